@@ -16,6 +16,10 @@ logger = logging.getLogger(__name__)
 # Global lock to ensure alerts send sequentially (prevents rate limiting)
 _alert_lock = asyncio.Lock()
 
+# Shared HTTP session: keeps the connection to Discord alive between alerts
+# so each one doesn't pay a new TCP + TLS handshake
+_session = requests.Session()
+
 # Discord embed colors (RGB as integer)
 COLOR_OK = 65280      # Green (#00FF00)
 COLOR_WARN = 16776960  # Yellow (#FFFF00)
@@ -66,6 +70,8 @@ def send_discord_webhook(webhook_url: str, embed: Dict[str, Any]) -> bool:
     
     This function sends a Discord embed to the specified webhook URL.
     It includes error handling and logging for successful and failed deliveries.
+    Blocks until Discord answers; call it from async code via a thread
+    (see send_alert_async).
     
     Args:
         webhook_url: Discord webhook URL
@@ -84,7 +90,7 @@ def send_discord_webhook(webhook_url: str, embed: Dict[str, Any]) -> bool:
     }
     
     try:
-        response = requests.post(
+        response = _session.post(
             webhook_url,
             json=payload,
             timeout=10
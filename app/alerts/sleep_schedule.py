@@ -16,8 +16,12 @@ Configuration via environment variables:
 import logging
 import os
 from datetime import datetime, time
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any, List
 
+from app.storage import insert_sleep_event, get_sleep_events, clear_sleep_events
+from app.alerts.maintenance import should_suppress_alert
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,16 +70,29 @@ def get_sleep_schedule() -> Tuple[Optional[time], Optional[time], bool]:
     """
     Get sleep schedule configuration.
     
+    Alerting checks this on every alert, so the parsed schedule is cached
+    per distinct set of environment values: the settings page can update
+    os.environ at runtime, and a changed value simply misses the cache.
+    
     Returns:
         Tuple of (start_time, end_time, enabled)
     """
-    enabled = os.getenv("SLEEP_SCHEDULE_ENABLED", "false").lower() == "true"
+    return _parse_sleep_schedule(
+        os.getenv("SLEEP_SCHEDULE_ENABLED", "false"),
+        os.getenv("SLEEP_SCHEDULE_START", ""),
+        os.getenv("SLEEP_SCHEDULE_END", ""),
+    )
+
+
+@lru_cache(maxsize=8)
+def _parse_sleep_schedule(
+    enabled_str: str, start_str: str, end_str: str
+) -> Tuple[Optional[time], Optional[time], bool]:
+    """Parse the sleep schedule environment values (see get_sleep_schedule)."""
+    enabled = enabled_str.lower() == "true"
     if not enabled:
         return (None, None, False)
     
-    start_str = os.getenv("SLEEP_SCHEDULE_START", "")
-    end_str = os.getenv("SLEEP_SCHEDULE_END", "")
-    
     start_time = parse_sleep_time(start_str)
     end_time = parse_sleep_time(end_str)
     
@@ -193,8 +210,6 @@ async def queue_sleep_event(event_data: Dict[str, Any]) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    from app.storage import insert_sleep_event
-    
     try:
         success = await insert_sleep_event(
             event_key=event_data.get('event_key', ''),
@@ -228,9 +243,6 @@ async def generate_morning_summary() -> Optional[Dict[str, Any]]:
     Returns:
         Discord embed dict or None if no events or summary disabled
     """
-    from app.storage import get_sleep_events, clear_sleep_events
-    from app.alerts.maintenance import should_suppress_alert
-    
     # Get sleep schedule times for summary period
     start_time, end_time, enabled = get_sleep_schedule()
     
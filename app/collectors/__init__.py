@@ -31,6 +31,8 @@ from .raid import (
 )
 from .modules.module_runner import (
     collect_all_app_metrics,
+    collect_app_metrics_for,
+    iter_app_metrics,
 )
 
 __all__ = [
@@ -44,4 +46,6 @@ __all__ = [
     "collect_all_smart_metrics",
     "collect_all_raid_metrics",
     "collect_all_app_metrics",
+    "collect_app_metrics_for",
+    "iter_app_metrics",
 ]
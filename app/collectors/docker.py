@@ -21,7 +21,7 @@ try:
 except ImportError:
     DOCKER_AVAILABLE = False
 
-from app.storage import insert_metric_sample
+from app.storage import buffer_metric_sample
 from app.alerts import process_alert
 
 logger = logging.getLogger(__name__)
@@ -413,7 +413,7 @@ async def store_container_status_metric(container_info: Dict[str, Any], status:
         # Status as numeric: 1 = running, 0 = not running
         value = 1 if container_info["state"] == "running" else 0
         
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="docker",
             name=f"container_{container_info['container_name']}_status",
             value_num=value,
@@ -438,7 +438,7 @@ async def store_container_cpu_metric(container_info: Dict[str, Any]) -> None:
             "container_name": container_info["container_name"],
         }
         
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="docker",
             name=f"container_{container_info['container_name']}_cpu",
             value_num=container_info["cpu_percent"],
@@ -464,7 +464,7 @@ async def store_container_memory_metric(container_info: Dict[str, Any]) -> None:
             "memory_limit_mb": container_info.get("memory_limit_mb"),
         }
         
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="docker",
             name=f"container_{container_info['container_name']}_memory",
             value_num=container_info["memory_mb"],
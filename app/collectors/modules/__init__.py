@@ -10,7 +10,7 @@ import logging
 import importlib
 import inspect
 from pathlib import Path
-from typing import List, Type, Dict, Any
+from typing import List, Optional, Type, Dict, Any
 
 from .base import AppModule
 
@@ -127,8 +127,9 @@ def _is_float(value: str) -> bool:
         return False
 
 
-# Module discovery cache (populated on first import)
-_discovered_modules: List[Type[AppModule]] = []
+# Module discovery cache (populated on first call; None = not yet discovered,
+# so an empty result is cached too instead of rescanning on every call)
+_discovered_modules: Optional[List[Type[AppModule]]] = None
 
 
 def get_discovered_modules() -> List[Type[AppModule]]:
@@ -143,7 +144,7 @@ def get_discovered_modules() -> List[Type[AppModule]]:
     """
     global _discovered_modules
     
-    if not _discovered_modules:
+    if _discovered_modules is None:
         _discovered_modules = discover_available_modules()
     
     return _discovered_modules
@@ -156,5 +157,5 @@ def clear_module_cache():
     Call this to force re-discovery of modules (useful for testing).
     """
     global _discovered_modules
-    _discovered_modules = []
+    _discovered_modules = None
     logger.debug("Module cache cleared")
@@ -5,24 +5,180 @@ Handles discovering, loading, and running app modules with proper
 error isolation and limit enforcement.
 """
 
+import asyncio
 import logging
 import time
-from typing import Dict, Any, List, Type
+from typing import AsyncIterator, Dict, Any, List, Set, Tuple, Type
 import docker
 
 from app.collectors.modules import get_discovered_modules, load_module_config
 from app.collectors.modules.base import AppModule
-from app.storage.db import insert_metric_sample
+from app.storage.db import buffer_metric_sample, flush_metric_samples
 from app.alerts.rules import process_alert
 
 logger = logging.getLogger(__name__)
 
+# Strong references to module collection tasks: asyncio only keeps weak
+# references, so a task whose creator went away could be garbage-collected
+# mid-run. Tasks drop out of the set when they finish.
+_running_tasks: Set[asyncio.Task] = set()
+
+
+def _track(task: asyncio.Task) -> asyncio.Task:
+    """Keep a strong reference to ``task`` until it finishes."""
+    _running_tasks.add(task)
+    task.add_done_callback(_running_tasks.discard)
+    return task
+
+
+async def _flush_when_done(tasks: List[asyncio.Task]) -> None:
+    """Wait for abandoned module tasks, then write the samples they buffered."""
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await flush_metric_samples()
+
 
 class APICallLimitExceeded(Exception):
     """Raised when a module exceeds the API call limit."""
     pass
 
 
+def _list_running_containers() -> List[Any]:
+    """
+    List running Docker containers for module matching.
+    
+    Uses the blocking Docker SDK, so callers run it in a worker thread.
+    
+    Returns:
+        List of container objects (empty if Docker is unavailable)
+    """
+    # Get Docker client
+    try:
+        client = docker.from_env()
+    except Exception as e:
+        logger.error(f"Failed to connect to Docker: {e}")
+        return []
+    
+    # Get running containers
+    try:
+        return client.containers.list()
+    except Exception as e:
+        logger.error(f"Failed to list Docker containers: {e}")
+        return []
+
+
+async def _collect_module(
+    module_class: Type[AppModule],
+    containers: List[Any],
+) -> Dict[str, Any]:
+    """
+    Run one module for its matching containers (or bare-metal) and store results.
+    
+    The module's API calls for all matched containers run concurrently;
+    results are then stored one container at a time.
+    
+    Args:
+        module_class: AppModule subclass to run
+        containers: Running Docker containers to match against
+        
+    Returns:
+        Dict of {"{app_name}_{container_name}": result} for this module
+    """
+    results = {}
+    app_name = module_class.APP_NAME
+    
+    # Load module configuration
+    config = load_module_config(app_name)
+    
+    # Check if this is a bare-metal module
+    is_bare_metal = config.get('bare_metal', False)
+    
+    if is_bare_metal:
+        # Bare-metal mode: run module once without a container
+        logger.info(
+            f"Running bare-metal module: {module_class.APP_DISPLAY_NAME}"
+        )
+        targets = [None]
+    else:
+        # Otherwise, require container match
+        targets = [
+            c for c in containers 
+            if module_class.detect(c)
+        ]
+        if not targets:
+            logger.debug(
+                f"No running containers found for module {app_name} "
+                f"(looking for: {', '.join(module_class.CONTAINER_NAMES)}). "
+                f"Set {app_name.upper()}_BARE_METAL=true to run without container."
+            )
+            return results
+    
+    # Run module for each target concurrently
+    outcomes = await asyncio.gather(
+        *(run_module(module_class, container, config) for container in targets),
+        return_exceptions=True
+    )
+    
+    for container, result in zip(targets, outcomes):
+        container_name = container.name if container else 'baremetal'
+        key = f"{app_name}_{container_name}"
+        try:
+            if isinstance(result, Exception):
+                raise result
+            results[key] = result
+            
+            # Store metrics in database if collection was successful
+            if result.get('status') == 'success':
+                await store_module_metrics(
+                    app_name=app_name,
+                    container_name=container_name,
+                    metrics=result.get('metrics', {}),
+                    config=config
+                )
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to run module {app_name} for {container_name}: {e}",
+                exc_info=True
+            )
+            results[key] = {
+                'status': 'error',
+                'error': str(e)
+            }
+    
+    return results
+
+
+async def _collect_modules(module_classes: List[Type[AppModule]]) -> Dict[str, Any]:
+    """
+    Run several modules concurrently against the running containers.
+    
+    Args:
+        module_classes: AppModule subclasses to run
+        
+    Returns:
+        Dict of {module_name: result}, in module order
+    """
+    results = {}
+    
+    # Docker SDK calls block, so keep them off the event loop
+    containers = await asyncio.to_thread(_list_running_containers)
+    
+    outcomes = await asyncio.gather(
+        *(_collect_module(module_class, containers) for module_class in module_classes),
+        return_exceptions=True
+    )
+    for module_class, outcome in zip(module_classes, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(
+                f"App module {module_class.APP_NAME} collection failed: {outcome}",
+                exc_info=outcome
+            )
+            continue
+        results.update(outcome)
+    
+    return results
+
+
 async def collect_all_app_metrics() -> Dict[str, Any]:
     """
     Discover and run all app modules for matching containers and bare-metal services.
@@ -51,104 +207,84 @@ async def collect_all_app_metrics() -> Dict[str, Any]:
             logger.debug("No app modules discovered")
             return results
         
-        # Get Docker client
+        # Match modules to containers and run collections (modules run
+        # concurrently; one slow app API no longer delays the others)
+        return await _collect_modules(modules)
+        
+    except Exception as e:
+        logger.error(f"App module collection failed: {e}", exc_info=True)
+        return results
+
+
+async def iter_app_metrics() -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Run all app modules concurrently, yielding results as modules finish.
+    
+    Same work as collect_all_app_metrics(), but each module's results are
+    handed over as soon as that module completes instead of after the
+    slowest one, so callers can stream them.
+    
+    Yields:
+        ("{app_name}_{container_name}", result) pairs, in completion order
+    """
+    modules = get_discovered_modules()
+    if not modules:
+        logger.debug("No app modules discovered")
+        return
+    
+    containers = await asyncio.to_thread(_list_running_containers)
+    
+    async def collect(module_class: Type[AppModule]) -> Dict[str, Any]:
         try:
-            client = docker.from_env()
+            return await _collect_module(module_class, containers)
         except Exception as e:
-            logger.error(f"Failed to connect to Docker: {e}")
-            client = None
+            logger.error(
+                f"App module {module_class.APP_NAME} collection failed: {e}",
+                exc_info=True
+            )
+            return {}
+    
+    tasks = [_track(asyncio.create_task(collect(module_class))) for module_class in modules]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for item in (await next_done).items():
+                yield item
+    finally:
+        # If the consumer stopped iterating early (e.g. a streaming client
+        # disconnected), let the remaining modules finish and flush their
+        # metrics once they do
+        pending = [task for task in tasks if not task.done()]
+        if pending:
+            _track(asyncio.create_task(_flush_when_done(pending)))
+
+
+async def collect_app_metrics_for(app_name: str) -> Dict[str, Any]:
+    """
+    Run only the module(s) with the given APP_NAME.
+    
+    Same as collect_all_app_metrics() restricted to one app, so other
+    modules' APIs aren't called when only one app is wanted.
+    
+    Args:
+        app_name: Module app name (e.g., 'homeassistant')
         
-        # Get running containers (if Docker is available)
-        containers = []
-        if client:
-            try:
-                containers = client.containers.list()
-            except Exception as e:
-                logger.error(f"Failed to list Docker containers: {e}")
+    Returns:
+        Dict of {module_name: result} for the requested module (empty if
+        the module is unknown or has no matching containers)
+    """
+    results = {}
+    
+    try:
+        modules = [m for m in get_discovered_modules() if m.APP_NAME == app_name]
         
-        # Match modules to containers and run collections
-        for module_class in modules:
-            app_name = module_class.APP_NAME
-            
-            # Load module configuration
-            config = load_module_config(app_name)
-            
-            # Check if this is a bare-metal module
-            is_bare_metal = config.get('bare_metal', False)
-            
-            # Find matching containers
-            matched_containers = [
-                c for c in containers 
-                if module_class.detect(c)
-            ]
-            
-            # If bare-metal mode, run module without container
-            if is_bare_metal:
-                logger.info(
-                    f"Running bare-metal module: {module_class.APP_DISPLAY_NAME}"
-                )
-                try:
-                    result = await run_module(module_class, None, config)
-                    results[f"{app_name}_baremetal"] = result
-                    
-                    # Store metrics if successful
-                    if result.get('status') == 'success':
-                        await store_module_metrics(
-                            app_name=app_name,
-                            container_name='baremetal',
-                            metrics=result.get('metrics', {}),
-                            config=config
-                        )
-                        
-                except Exception as e:
-                    logger.error(
-                        f"Failed to run bare-metal module {app_name}: {e}",
-                        exc_info=True
-                    )
-                    results[f"{app_name}_baremetal"] = {
-                        'status': 'error',
-                        'error': str(e)
-                    }
-                continue
-            
-            # Otherwise, require container match
-            if not matched_containers:
-                logger.debug(
-                    f"No running containers found for module {app_name} "
-                    f"(looking for: {', '.join(module_class.CONTAINER_NAMES)}). "
-                    f"Set {app_name.upper()}_BARE_METAL=true to run without container."
-                )
-                continue
-            
-            # Run module for each matched container
-            for container in matched_containers:
-                try:
-                    result = await run_module(module_class, container, config)
-                    results[f"{app_name}_{container.name}"] = result
-                    
-                    # Store metrics in database if collection was successful
-                    if result.get('status') == 'success':
-                        await store_module_metrics(
-                            app_name=app_name,
-                            container_name=container.name,
-                            metrics=result.get('metrics', {}),
-                            config=config
-                        )
-                    
-                except Exception as e:
-                    logger.error(
-                        f"Failed to run module {app_name} for container {container.name}: {e}",
-                        exc_info=True
-                    )
-                    results[f"{app_name}_{container.name}"] = {
-                        'status': 'error',
-                        'error': str(e)
-                    }
+        if not modules:
+            logger.debug(f"No app module named {app_name}")
+            return results
         
-        return results
+        return await _collect_modules(modules)
         
     except Exception as e:
-        logger.error(f"App module collection failed: {e}", exc_info=True)
+        logger.error(f"App module collection failed for {app_name}: {e}", exc_info=True)
         return results
 
 
@@ -277,7 +413,7 @@ async def store_module_metrics(
         
         try:
             # Store in database
-            await insert_metric_sample(
+            await buffer_metric_sample(
                 category='app',
                 name=full_metric_name,
                 value_num=value_num,
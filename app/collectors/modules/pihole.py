@@ -226,7 +226,7 @@ class PiHoleModule(AppModule):
             return (False, "api_url is required")
         
         api_url = config['api_url']
-        if not api_url.startswith('http://') and not api_url.startswith('https://'):
+        if not api_url.startswith(('http://', 'https://')):
             return (False, "api_url must start with http:// or https://")
         
         if 'api_password' not in config or not config['api_password']:
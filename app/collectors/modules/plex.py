@@ -219,7 +219,7 @@ class PlexModule(AppModule):
         if 'api_url' not in config or not config['api_url']:
             return (False, "api_url is required")
         
-        if not config['api_url'].startswith('http://') and not config['api_url'].startswith('https://'):
+        if not config['api_url'].startswith(('http://', 'https://')):
             return (False, "api_url must start with http:// or https://")
         
         if 'api_token' not in config or not config['api_token']:
@@ -17,7 +17,7 @@ import json
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
-from app.storage import insert_metric_sample
+from app.storage import buffer_metric_sample
 from app.alerts import process_alert
 
 logger = logging.getLogger(__name__)
@@ -238,7 +238,7 @@ def parse_all_arrays(mdstat_content: str) -> List[Dict[str, Any]]:
         line = lines[i]
         
         # Skip header lines and empty lines
-        if line.startswith('Personalities') or line.startswith('unused') or not line.strip():
+        if line.startswith(('Personalities', 'unused')) or not line.strip():
             i += 1
             continue
         
@@ -249,7 +249,7 @@ def parse_all_arrays(mdstat_content: str) -> List[Dict[str, Any]]:
             i += 1
             
             # Collect following indented lines (status and rebuild info)
-            while i < len(lines) and (lines[i].startswith('      ') or lines[i].startswith('\t')):
+            while i < len(lines) and (lines[i].startswith(('      ', '\t'))):
                 array_lines.append(lines[i])
                 i += 1
             
@@ -309,7 +309,7 @@ async def store_raid_metrics(array: Dict[str, Any]) -> None:
         overall_status = 'FAIL'
     
     # Store array health metric
-    await insert_metric_sample(
+    await buffer_metric_sample(
         category="raid",
         name=f"array_{array_name}_health",
         value_num=1 if overall_status == 'OK' else 0,
@@ -325,7 +325,7 @@ async def store_raid_metrics(array: Dict[str, Any]) -> None:
     
     # Store active disk count (critical metric!)
     disk_status = 'OK' if array['active_devices'] == array['total_devices'] else 'FAIL'
-    await insert_metric_sample(
+    await buffer_metric_sample(
         category="raid",
         name=f"array_{array_name}_active_disks",
         value_num=array['active_devices'],
@@ -340,7 +340,7 @@ async def store_raid_metrics(array: Dict[str, Any]) -> None:
     
     # Store rebuild progress if rebuilding
     if array['rebuild_progress'] is not None:
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="raid",
             name=f"array_{array_name}_rebuild_progress",
             value_num=array['rebuild_progress'],
@@ -21,7 +21,7 @@ import subprocess
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
-from app.storage import insert_metric_sample
+from app.storage import buffer_metric_sample
 from app.alerts import process_alert
 
 logger = logging.getLogger(__name__)
@@ -351,7 +351,7 @@ async def store_smart_health_metric(smart_data: Dict[str, Any]) -> None:
             "smart_health": health
         }
         
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="smart",
             name=f"drive_{device.replace('/', '_')}_health",
             value_num=value,
@@ -385,7 +385,7 @@ async def store_temperature_metric(smart_data: Dict[str, Any]) -> None:
             "model": smart_data["model"]
         }
         
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="smart",
             name=f"drive_{device.replace('/', '_')}_temperature",
             value_num=temperature,
@@ -416,7 +416,7 @@ async def store_reallocated_sectors_metric(smart_data: Dict[str, Any]) -> None:
             "model": smart_data["model"]
         }
         
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="smart",
             name=f"drive_{device.replace('/', '_')}_reallocated_sectors",
             value_num=reallocated,
@@ -447,7 +447,7 @@ async def store_pending_sectors_metric(smart_data: Dict[str, Any]) -> None:
             "model": smart_data["model"]
         }
         
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="smart",
             name=f"drive_{device.replace('/', '_')}_pending_sectors",
             value_num=pending,
@@ -477,7 +477,7 @@ async def store_power_on_hours_metric(smart_data: Dict[str, Any]) -> None:
             "model": smart_data["model"]
         }
         
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="smart",
             name=f"drive_{device.replace('/', '_')}_power_on_hours",
             value_num=hours,
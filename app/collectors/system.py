@@ -4,12 +4,14 @@ System metrics collector for HomeSentry
 Monitors CPU, RAM, and disk usage with threshold-based status determination.
 Automatically writes metrics to the database for tracking and alerting.
 """
+import asyncio
 import logging
 import os
 import json
+import time
 from datetime import datetime
 import psutil
-from app.storage import insert_metric_sample
+from app.storage import COLLECTOR_TIMING_CATEGORY, buffer_metric_sample
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +43,19 @@ REAL_FSTYPES = {
     "fuseblk",
 }
 
+# Kernel memory accounting file (Linux only) and the counters we need from it
+PROC_MEMINFO_PATH = "/proc/meminfo"
+MEMINFO_FIELDS = {
+    b"MemTotal",
+    b"MemFree",
+    b"MemAvailable",
+    b"Buffers",
+    b"Cached",
+    b"SReclaimable",
+    b"SwapTotal",
+    b"SwapFree",
+}
+
 
 # ============================================================================
 # Status Determination Functions
@@ -170,6 +185,102 @@ def is_real_disk(partition) -> bool:
     return True
 
 
+def read_meminfo() -> dict | None:
+    """
+    Read memory and swap counters from /proc/meminfo in a single pass.
+
+    psutil.virtual_memory() and psutil.swap_memory() each re-read and re-parse
+    /proc/meminfo (swap also reads /proc/vmstat). We only need a handful of
+    counters, so one read of the file covers both RAM and swap.
+
+    Returns:
+        Dict mapping counter name (e.g. "MemTotal") to bytes, or None if
+        /proc/meminfo is unavailable (non-Linux) or incomplete
+    """
+    try:
+        with open(PROC_MEMINFO_PATH, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    fields = {}
+    for line in data.splitlines():
+        key, _, rest = line.partition(b":")
+        if key in MEMINFO_FIELDS:
+            # Values are reported in kB
+            fields[key.decode()] = int(rest.split()[0]) * 1024
+
+    # Older kernels (< 3.14) lack MemAvailable - let psutil estimate it
+    if "MemTotal" not in fields or "MemAvailable" not in fields:
+        return None
+    return fields
+
+
+def get_memory_snapshot() -> dict:
+    """
+    Get RAM and swap usage in bytes, matching psutil's accounting.
+
+    Uses read_meminfo() on Linux and falls back to psutil elsewhere.
+
+    Returns:
+        Dict with keys: total, used, available, percent,
+        swap_total, swap_used, swap_percent
+    """
+    meminfo = read_meminfo()
+    if meminfo is None:
+        mem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        return {
+            "total": mem.total,
+            "used": mem.used,
+            "available": mem.available,
+            "percent": mem.percent,
+            "swap_total": swap.total,
+            "swap_used": swap.used,
+            "swap_percent": swap.percent,
+        }
+
+    total = meminfo["MemTotal"]
+    free = meminfo.get("MemFree", 0)
+    available = meminfo["MemAvailable"]
+    cached = meminfo.get("Cached", 0) + meminfo.get("SReclaimable", 0)
+
+    # Same "used" definition as psutil (excludes buffers and page cache)
+    used = total - free - cached - meminfo.get("Buffers", 0)
+    if used < 0:
+        used = total - free
+
+    swap_total = meminfo.get("SwapTotal", 0)
+    swap_used = swap_total - meminfo.get("SwapFree", 0)
+
+    return {
+        "total": total,
+        "used": used,
+        "available": available,
+        "percent": round((total - available) / total * 100, 1) if total else 0.0,
+        "swap_total": swap_total,
+        "swap_used": swap_used,
+        "swap_percent": round(swap_used / swap_total * 100, 1) if swap_total else 0.0,
+    }
+
+
+def _sync_sample_cpu() -> tuple:
+    """
+    Sample CPU usage (blocking - run in an executor).
+
+    psutil.cpu_percent() sleeps for its sampling interval, so calling it on
+    the event loop would stall request handling for over a second per poll.
+
+    Returns:
+        Tuple of (cpu_percent, per_core list, load averages tuple)
+    """
+    # interval=1 ensures accurate reading
+    cpu_percent = psutil.cpu_percent(interval=1)
+    cpu_per_core = psutil.cpu_percent(interval=0.1, percpu=True)
+    load_avg = psutil.getloadavg()
+    return cpu_percent, cpu_per_core, load_avg
+
+
 # ============================================================================
 # Metric Collection Functions
 # ============================================================================
@@ -192,10 +303,8 @@ async def collect_cpu_metrics() -> dict | None:
         }
     """
     try:
-        # Collect CPU data (interval=1 ensures accurate reading)
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_per_core = psutil.cpu_percent(interval=0.1, percpu=True)
-        load_avg = psutil.getloadavg()
+        # Collect CPU data off the event loop (sampling blocks ~1.1s)
+        cpu_percent, cpu_per_core, load_avg = await asyncio.to_thread(_sync_sample_cpu)
 
         # Determine status based on overall CPU usage
         status = determine_cpu_status(cpu_percent)
@@ -211,7 +320,7 @@ async def collect_cpu_metrics() -> dict | None:
         )
 
         # Insert main CPU percentage metric
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="system",
             name="cpu_percent",
             value_num=cpu_percent,
@@ -220,15 +329,15 @@ async def collect_cpu_metrics() -> dict | None:
         )
 
         # Also insert load averages as separate metrics
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="system", name="cpu_load_1m", value_num=load_avg[0], status="OK"
         )
 
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="system", name="cpu_load_5m", value_num=load_avg[1], status="OK"
         )
 
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="system", name="cpu_load_15m", value_num=load_avg[2], status="OK"
         )
 
@@ -268,19 +377,20 @@ async def collect_memory_metrics() -> dict | None:
         }
     """
     try:
-        # Collect memory data
-        mem = psutil.virtual_memory()
-        swap = psutil.swap_memory()
+        # Collect memory data (single /proc/meminfo read on Linux)
+        mem = get_memory_snapshot()
+        mem_percent = mem["percent"]
+        swap_percent = mem["swap_percent"]
 
         # Convert bytes to GB
-        total_gb = mem.total / (1024**3)
-        used_gb = mem.used / (1024**3)
-        available_gb = mem.available / (1024**3)
-        swap_total_gb = swap.total / (1024**3)
-        swap_used_gb = swap.used / (1024**3)
+        total_gb = mem["total"] / (1024**3)
+        used_gb = mem["used"] / (1024**3)
+        available_gb = mem["available"] / (1024**3)
+        swap_total_gb = mem["swap_total"] / (1024**3)
+        swap_used_gb = mem["swap_used"] / (1024**3)
 
         # Determine status based on memory usage percentage
-        status = determine_memory_status(mem.percent)
+        status = determine_memory_status(mem_percent)
 
         # Build details JSON
         details = json.dumps(
@@ -290,21 +400,21 @@ async def collect_memory_metrics() -> dict | None:
                 "available_gb": round(available_gb, 2),
                 "swap_total_gb": round(swap_total_gb, 2),
                 "swap_used_gb": round(swap_used_gb, 2),
-                "swap_percent": swap.percent,
+                "swap_percent": swap_percent,
             }
         )
 
         # Insert memory percentage metric
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="system",
             name="memory_percent",
-            value_num=mem.percent,
+            value_num=mem_percent,
             status=status,
             details_json=details,
         )
 
         # Insert memory used in GB
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="system",
             name="memory_used_gb",
             value_num=used_gb,
@@ -312,7 +422,7 @@ async def collect_memory_metrics() -> dict | None:
         )
 
         # Insert total memory
-        await insert_metric_sample(
+        await buffer_metric_sample(
             category="system",
             name="memory_total_gb",
             value_num=total_gb,
@@ -320,16 +430,16 @@ async def collect_memory_metrics() -> dict | None:
         )
 
         logger.info(
-            f"Collected memory metrics: {mem.percent:.1f}% ({used_gb:.1f}GB / {total_gb:.1f}GB) ({status})"
+            f"Collected memory metrics: {mem_percent:.1f}% ({used_gb:.1f}GB / {total_gb:.1f}GB) ({status})"
         )
 
         return {
             "total_gb": round(total_gb, 2),
             "used_gb": round(used_gb, 2),
             "available_gb": round(available_gb, 2),
-            "percent": mem.percent,
+            "percent": mem_percent,
             "swap_used_gb": round(swap_used_gb, 2),
-            "swap_percent": swap.percent,
+            "swap_percent": swap_percent,
             "status": status,
         }
 
@@ -405,7 +515,7 @@ async def collect_disk_metrics() -> dict | None:
                 mount_name = partition.mountpoint.replace("/", "_") or "_root"
 
                 # Insert disk percentage metric
-                await insert_metric_sample(
+                await buffer_metric_sample(
                     category="disk",
                     name=f"disk{mount_name}_percent",
                     value_num=percent_used,
@@ -414,7 +524,7 @@ async def collect_disk_metrics() -> dict | None:
                 )
 
                 # Insert disk free space in GB
-                await insert_metric_sample(
+                await buffer_metric_sample(
                     category="disk",
                     name=f"disk{mount_name}_free_gb",
                     value_num=free_gb,
@@ -464,13 +574,39 @@ async def collect_all_system_metrics() -> dict:
     """
     timestamp = datetime.utcnow().isoformat()
 
+    # Time each collector so the monitor's own overhead is observable
+    t0 = time.perf_counter_ns()
+    cpu = await collect_cpu_metrics()
+    t1 = time.perf_counter_ns()
+    memory = await collect_memory_metrics()
+    t2 = time.perf_counter_ns()
+    disk = await collect_disk_metrics()
+    t3 = time.perf_counter_ns()
+
     results = {
-        "cpu": await collect_cpu_metrics(),
-        "memory": await collect_memory_metrics(),
-        "disk": await collect_disk_metrics(),
+        "cpu": cpu,
+        "memory": memory,
+        "disk": disk,
         "timestamp": timestamp,
     }
 
+    # One row per collector, in the same flush batch as the samples; the
+    # category keeps them out of the dashboard, APIs and /metrics
+    for name, elapsed_ns in (
+        ("cpu_collect_ns", t1 - t0),
+        ("memory_collect_ns", t2 - t1),
+        ("disk_collect_ns", t3 - t2),
+    ):
+        await buffer_metric_sample(
+            category=COLLECTOR_TIMING_CATEGORY,
+            name=name,
+            value_num=elapsed_ns,
+        )
+    logger.debug(
+        "System collector timings: cpu=%.1fms memory=%.1fms disk=%.1fms",
+        (t1 - t0) / 1e6, (t2 - t1) / 1e6, (t3 - t2) / 1e6,
+    )
+
     # Determine overall status (worst status wins)
     statuses = []
     if results["cpu"]:
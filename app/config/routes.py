@@ -7,38 +7,109 @@ Configuration is read from environment variables (loaded by Docker Compose from
 
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from typing import Dict, Any, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 from pydantic import BaseModel
 
-from app.config.module_fields import MODULE_FIELDS
+from app.config.module_fields import get_module_fields, get_required_fields
+from app.http_cache import compute_etag, etag_matches
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Define sensitive field suffixes for masking
-SENSITIVE_SUFFIXES = ["_TOKEN", "_PASSWORD", "_API_KEY", "_WEBHOOK_URL"]
+# Define sensitive field suffixes for masking (a tuple, so str.endswith can
+# check them all in one call)
+SENSITIVE_SUFFIXES = ("_TOKEN", "_PASSWORD", "_API_KEY", "_WEBHOOK_URL")
 
 # Placeholder for masked sensitive values
 MASKED_PLACEHOLDER = "••••••••••••••••"  # 16 bullets
 
+# Values that mean "unchanged, still masked" when posted back by the UI
+# ("***sensitive***" is the placeholder used by earlier versions)
+MASKED_VALUES = frozenset((MASKED_PLACEHOLDER, "***sensitive***"))
 
-def is_sensitive_field(key: str) -> bool:
-    """Check if a field is sensitive based on its key."""
-    return any(key.upper().endswith(suffix) for suffix in SENSITIVE_SUFFIXES)
+# Fixed text of the generated .env file
+ENV_FILE_HEADER = (
+    "# HomeSentry Configuration\n"
+    "# Generated by Web Configuration UI\n"
+    "# DO NOT commit .env file to Git (it contains secrets)\n"
+    "\n"
+)
+SECTION_RULE = "# " + "=" * 76
+SECTION_HEADERS = {
+    section: f"{SECTION_RULE}\n# {title}\n{SECTION_RULE}"
+    for section, title in (
+        ("core", "Core Settings"),
+        ("modules", "Application Modules"),
+        ("infrastructure", "Infrastructure Settings"),
+        ("advanced", "Advanced Settings"),
+    )
+}
 
+# Environment variable prefixes for each configuration section
+SECTION_PREFIXES = {
+    "core": ["DISCORD_", "POLL_", "LOG_", "DATABASE_"],
+    "modules": ["HOMEASSISTANT_", "QBITTORRENT_", "PIHOLE_", "PLEX_", "JELLYFIN_"],
+    "infrastructure": ["CPU_", "MEMORY_", "DISK_", "DOCKER_", "SMART_", "RAID_", "SERVICE_", "CONTAINER_"],
+    "advanced": ["ALERTS_", "ALERT_", "SLEEP_", "MAINTENANCE_", "GLOBAL_MAINTENANCE_"],
+}
 
-def mask_sensitive_value(value: str) -> str:
+# Lowercase module names in display order, e.g. "homeassistant"
+MODULE_NAMES = tuple(prefix.rstrip("_").lower() for prefix in SECTION_PREFIXES["modules"])
+
+# Prefix (without its trailing "_") -> section
+PREFIX_TO_SECTION = {
+    prefix.rstrip("_"): section
+    for section, prefixes in SECTION_PREFIXES.items()
+    for prefix in prefixes
+}
+
+# One compiled alternation over every known prefix: group 1 is the prefix,
+# group 2 the rest of the key. Longest prefixes first so e.g. "ALERTS"
+# is tried before "ALERT". sre rejects non-matching keys on their first
+# character, which measured about twice as fast as a first-letter bucket
+# table of startswith() checks.
+SECTION_RE = re.compile(
+    r"^("
+    + "|".join(re.escape(p) for p in sorted(PREFIX_TO_SECTION, key=len, reverse=True))
+    + r")_(.*)$",
+    re.DOTALL,
+)
+
+# (ETag, grouped configuration) served by GET /api/config. Environment
+# variables only change in this process when update_config() rewrites them,
+# so the grouped result is cached until then instead of being rebuilt on
+# every request.
+_config_cache: Optional[Tuple[str, Dict[str, Dict[str, Any]]]] = None
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached GET /api/config payload (call after changing os.environ)."""
+    global _config_cache
+    _config_cache = None
+
+
+def _is_sensitive(key: str) -> bool:
+    """Check if a field is sensitive based on its env var key (case-insensitive)."""
+    return key.upper().endswith(SENSITIVE_SUFFIXES)
+
+
+def _mask_sensitive(key: str, value: str) -> str:
     """
     Mask a sensitive value for display.
-    Returns a placeholder that indicates the field has a value without showing it.
+    Non-empty sensitive values become a placeholder that indicates the field
+    has a value without showing it; everything else is returned unchanged.
     """
-    if not value:
-        return ""
-    return MASKED_PLACEHOLDER
+    if value and _is_sensitive(key):
+        return MASKED_PLACEHOLDER
+    return value
 
 
 def group_env_vars_by_section(env_dict: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
@@ -58,51 +129,37 @@ def group_env_vars_by_section(env_dict: Dict[str, str]) -> Dict[str, Dict[str, A
         "advanced": {}
     }
     
-    # Core settings
-    core_prefixes = ["DISCORD_", "POLL_", "LOG_", "DATABASE_"]
-    for key, value in env_dict.items():
-        if any(key.startswith(prefix) for prefix in core_prefixes):
-            if is_sensitive_field(key):
-                value = mask_sensitive_value(value)
-            result["core"][key.lower()] = value
+    # Module vars bucketed by module name during the single pass below
+    module_vars: Dict[str, Dict[str, Any]] = {}
     
-    # Module settings
-    module_prefixes = ["HOMEASSISTANT_", "QBITTORRENT_", "PIHOLE_", "PLEX_", "JELLYFIN_"]
-    for module_prefix in module_prefixes:
-        module_name = module_prefix.rstrip("_").lower()
-        module_vars = {}
-        enabled = False
-        
-        for key, value in env_dict.items():
-            if key.startswith(module_prefix):
-                enabled = True
-                field_name = key[len(module_prefix):].lower()
-                if is_sensitive_field(key):
-                    value = mask_sensitive_value(value)
-                module_vars[field_name] = value
+    # Single pass: one regex match per key yields both section and field name
+    for key, value in env_dict.items():
+        match = SECTION_RE.match(key)
+        if match is None:
+            continue
+        token, rest = match.groups()
+        section = PREFIX_TO_SECTION[token]
         
-        if enabled:
+        # Sensitive values are masked by the full key, whatever its case
+        if section == "modules":
+            module_vars.setdefault(token.lower(), {})[rest.lower()] = _mask_sensitive(key, value)
+        elif section == "core":
+            result["core"][key.lower()] = _mask_sensitive(key, value)
+        else:
+            result[section][key.lower()] = value
+    
+    # Every known module is listed, enabled or not (in MODULE_NAMES order)
+    for module_name in MODULE_NAMES:
+        if module_name in module_vars:
             result["modules"][module_name] = {
                 "enabled": True,
-                **module_vars
+                **module_vars[module_name]
             }
         else:
             result["modules"][module_name] = {
                 "enabled": False
             }
     
-    # Infrastructure settings
-    infra_prefixes = ["CPU_", "MEMORY_", "DISK_", "DOCKER_", "SMART_", "RAID_", "SERVICE_", "CONTAINER_"]
-    for key, value in env_dict.items():
-        if any(key.startswith(prefix) for prefix in infra_prefixes):
-            result["infrastructure"][key.lower()] = value
-    
-    # Advanced settings
-    advanced_prefixes = ["ALERTS_", "ALERT_", "SLEEP_", "MAINTENANCE_", "GLOBAL_MAINTENANCE_"]
-    for key, value in env_dict.items():
-        if any(key.startswith(prefix) for prefix in advanced_prefixes):
-            result["advanced"][key.lower()] = value
-    
     return result
 
 
@@ -123,156 +180,236 @@ def validate_config(config: Dict[str, Any]) -> Tuple[bool, Dict[str, str]]:
         core = config["core"]
         if "discord_webhook_url" in core:
             webhook = core["discord_webhook_url"]
-            if webhook and webhook != "***sensitive***":
+            if webhook and webhook not in MASKED_VALUES:
                 if not webhook.startswith("https://discord.com/api/webhooks/"):
                     errors["core.discord_webhook_url"] = "Must start with https://discord.com/api/webhooks/"
     
-    # Validate module settings
-    if "modules" in config:
-        for module_name, module_config in config["modules"].items():
+    # Validate module settings (nothing to check unless a module is enabled)
+    modules = config.get("modules")
+    if modules:
+        required_fields = get_required_fields()
+        for module_name, module_config in modules.items():
             if not module_config.get("enabled", False):
                 continue
             
-            if module_name not in MODULE_FIELDS:
-                continue
-            
-            # Check required fields for enabled modules
-            for field_def in MODULE_FIELDS[module_name]["fields"]:
-                if not field_def.get("required", False):
-                    continue
-                
-                field_key = field_def["key"]
+            # Check required fields for enabled modules (unknown modules have none)
+            for field_key, field_label in required_fields.get(module_name, ()):
                 field_value = module_config.get(field_key, "")
                 
                 # Skip validation if field is still masked
-                if field_value == "***sensitive***":
+                if field_value in MASKED_VALUES:
                     continue
                 
                 if not field_value:
-                    field_label = field_def.get("label", field_key)
                     errors[f"modules.{module_name}.{field_key}"] = f"{field_label} is required when module is enabled"
     
-    return (len(errors) == 0, errors)
+    return (not errors, errors)
+
+
+@lru_cache(maxsize=32)
+def _validate_config_json(config_json: bytes) -> Tuple[bool, Tuple[Tuple[str, str], ...]]:
+    """Run validate_config on a canonical JSON payload (cached by payload)."""
+    is_valid, errors = validate_config(orjson.loads(config_json))
+    return is_valid, tuple(errors.items())
+
+
+def _is_secret_value(key: str, value: Any) -> bool:
+    """Check if a posted field carries a real (non-placeholder) sensitive value."""
+    if not value or not _is_sensitive(key):
+        return False
+    return not (isinstance(value, str) and value in MASKED_VALUES)
+
 
+def _contains_secrets(config: Dict[str, Any]) -> bool:
+    """Check if a config payload carries any unmasked sensitive values."""
+    core = config.get("core")
+    if isinstance(core, dict):
+        if any(_is_secret_value(key, value) for key, value in core.items()):
+            return True
+    modules = config.get("modules")
+    if isinstance(modules, dict):
+        for module_name, module_config in modules.items():
+            if isinstance(module_config, dict) and any(
+                _is_secret_value(f"{module_name}_{key}", value)
+                for key, value in module_config.items()
+            ):
+                return True
+    return False
 
-def build_env_content(config: Dict[str, Any], current_env: Dict[str, str]) -> str:
+
+def validate_config_cached(config: Dict[str, Any]) -> Tuple[bool, Dict[str, str]]:
     """
-    Build .env file content from configuration.
+    Memoized validate_config.
+    
+    The UI typically validates and then saves the same payload, so results
+    are cached by the payload's sorted-key JSON encoding; a repeated
+    payload costs one encode and a dict lookup. Validation only depends on
+    the payload and the (immutable) module field definitions.
+    
+    Payloads carrying unmasked secrets (so they aren't kept in memory) and
+    payloads orjson can't encode (e.g. integers wider than 64 bits) are
+    validated without the cache.
     
     Args:
-        config: New configuration dictionary
-        current_env: Current .env values (for preserving masked sensitive fields)
+        config: Configuration dictionary with sections
         
     Returns:
-        Complete .env file content as string
+        Tuple of (is_valid, errors_dict)
     """
-    lines = []
+    if _contains_secrets(config):
+        return validate_config(config)
+    try:
+        config_json = orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        return validate_config(config)
+    is_valid, errors = _validate_config_json(config_json)
+    return is_valid, dict(errors)
+
+
+def write_env_content(config: Dict[str, Any], current_env: Dict[str, str], path: Path) -> Dict[str, str]:
+    """
+    Write .env file content from configuration.
     
-    # Header
-    lines.append("# HomeSentry Configuration")
-    lines.append("# Generated by Web Configuration UI")
-    lines.append("# DO NOT commit .env file to Git (it contains secrets)")
-    lines.append("")
+    Each section is built and written to ``path`` as soon as it is ready,
+    so the whole file is never held in memory as one string.
     
-    # Core section
-    lines.append("# " + "=" * 76)
-    lines.append("# Core Settings")
-    lines.append("# " + "=" * 76)
+    Args:
+        config: New configuration dictionary
+        current_env: Current .env values (for preserving masked sensitive fields)
+        path: File to write (normally a temporary file renamed into place)
+        
+    Returns:
+        Dictionary of every KEY=value pair written, for syncing os.environ
+    """
+    written: Dict[str, str] = {}
+    get_current = current_env.get
     
-    if "core" in config:
-        for key, value in sorted(config["core"].items()):
-            env_key = key.upper()
-            # Preserve masked sensitive values (if user didn't change the placeholder)
-            if value == MASKED_PLACEHOLDER and env_key in current_env:
-                value = current_env[env_key]
-            lines.append(f"{env_key}={value}")
+    def env_line(env_key: str, value: Any) -> str:
+        value = f"{value}"
+        written[env_key] = value
+        return f"{env_key}={value}"
     
-    lines.append("")
+    def masked_env_line(env_key: str, value: Any) -> str:
+        # Preserve masked sensitive values (if user didn't change the placeholder)
+        if value == MASKED_PLACEHOLDER and _is_sensitive(env_key):
+            value = get_current(env_key, value)
+        return env_line(env_key, value)
     
-    # Modules section
-    lines.append("# " + "=" * 76)
-    lines.append("# Application Modules")
-    lines.append("# " + "=" * 76)
+    def section(name: str, body: List[str]) -> str:
+        return "\n".join([SECTION_HEADERS[name], *body])
     
-    if "modules" in config:
-        for module_name, module_config in sorted(config["modules"].items()):
+    with path.open("w", encoding="utf-8") as f:
+        f.write(ENV_FILE_HEADER)
+        
+        core_lines = [
+            masked_env_line(key.upper(), value)
+            for key, value in sorted(config.get("core", {}).items())
+        ]
+        f.write(section("core", core_lines))
+        f.write("\n\n")
+        
+        module_lines: List[str] = []
+        module_fields = get_module_fields()
+        for module_name, module_config in sorted(config.get("modules", {}).items()):
             if not module_config.get("enabled", False):
                 continue
-            
             module_prefix = module_name.upper()
-            lines.append("")
-            lines.append(f"# {MODULE_FIELDS.get(module_name, {}).get('display_name', module_name)}")
-            
-            for key, value in sorted(module_config.items()):
-                if key == "enabled":
-                    continue
-                env_key = f"{module_prefix}_{key.upper()}"
-                # Preserve masked sensitive values (if user didn't change the placeholder)
-                if value == MASKED_PLACEHOLDER and env_key in current_env:
-                    value = current_env[env_key]
-                lines.append(f"{env_key}={value}")
-    
-    lines.append("")
-    
-    # Infrastructure section
-    lines.append("# " + "=" * 76)
-    lines.append("# Infrastructure Settings")
-    lines.append("# " + "=" * 76)
-    
-    if "infrastructure" in config:
-        for key, value in sorted(config["infrastructure"].items()):
-            env_key = key.upper()
-            lines.append(f"{env_key}={value}")
-    
-    lines.append("")
-    
-    # Advanced section
-    lines.append("# " + "=" * 76)
-    lines.append("# Advanced Settings")
-    lines.append("# " + "=" * 76)
+            module_lines.append("")
+            module_lines.append(f"# {module_fields.get(module_name, {}).get('display_name', module_name)}")
+            module_lines.extend(
+                masked_env_line(f"{module_prefix}_{key.upper()}", value)
+                for key, value in sorted(module_config.items())
+                if key != "enabled"
+            )
+        f.write(section("modules", module_lines))
+        f.write("\n\n")
+        
+        infra_lines = [
+            env_line(key.upper(), value)
+            for key, value in sorted(config.get("infrastructure", {}).items())
+        ]
+        f.write(section("infrastructure", infra_lines))
+        f.write("\n\n")
+        
+        advanced_lines = [
+            env_line(key.upper(), value)
+            for key, value in sorted(config.get("advanced", {}).items())
+        ]
+        f.write(section("advanced", advanced_lines))
+        f.write("\n")
+        
+        # Make sure the data is on disk before the file is renamed into place
+        f.flush()
+        os.fsync(f.fileno())
     
-    if "advanced" in config:
-        for key, value in sorted(config["advanced"].items()):
-            env_key = key.upper()
-            lines.append(f"{env_key}={value}")
+    return written
+
+
+def replace_file(tmp_path: Path, path: Path) -> None:
+    """
+    Atomically replace ``path`` with ``tmp_path`` and persist the rename.
     
-    lines.append("")
+    os.replace overwrites an existing target on every platform (unlike
+    Path.rename on Windows); fsyncing the parent directory makes the new
+    directory entry survive a crash.
     
-    return "\n".join(lines)
+    Args:
+        tmp_path: Fully written (and fsynced) temporary file
+        path: Destination file, in the same directory as tmp_path
+    """
+    os.replace(tmp_path, path)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        # Directories can't be opened for fsync on some platforms (Windows)
+        return
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
 @router.get("/api/config")
-async def get_config() -> JSONResponse:
+async def get_config(request: Request) -> Response:
     """
     Get current configuration from environment variables.
     
     Returns current configuration grouped by sections.
-    Sensitive fields are masked.
+    Sensitive fields are masked. Responses carry an ETag; a request whose
+    If-None-Match matches gets an empty 304 Not Modified.
     
     Note: In Docker, environment variables are loaded from .env by docker-compose.
     This is the proper way to handle config in containerized apps.
     """
+    global _config_cache
     try:
+        if _config_cache is not None:
+            etag, grouped = _config_cache
+            if etag_matches(request, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            return ORJSONResponse(content=grouped, headers={"ETag": etag})
+        
         # Read all environment variables
         env_dict = dict(os.environ)
-        logger.info(f"Reading configuration from {len(env_dict)} environment variables")
+        logger.info("Reading configuration from %d environment variables", len(env_dict))
         
         # Filter to only HomeSentry-related variables
+        # (SECTION_RE matches every known section prefix in one C-level scan)
+        match_prefix = SECTION_RE.match
         homesentry_vars = {
             k: v for k, v in env_dict.items()
-            if any(k.startswith(prefix) for prefix in [
-                "DISCORD_", "POLL_", "LOG_", "DATABASE_",
-                "HOMEASSISTANT_", "QBITTORRENT_", "PIHOLE_", "PLEX_", "JELLYFIN_",
-                "CPU_", "MEMORY_", "DISK_", "DOCKER_", "SMART_", "RAID_", "SERVICE_", "CONTAINER_",
-                "ALERTS_", "ALERT_", "SLEEP_", "MAINTENANCE_", "GLOBAL_MAINTENANCE_"
-            ])
+            if match_prefix(k)
         }
         
-        logger.info(f"Found {len(homesentry_vars)} HomeSentry configuration variables")
+        logger.info("Found %d HomeSentry configuration variables", len(homesentry_vars))
         
-        grouped = group_env_vars_by_section(homesentry_vars)
+        grouped = await run_in_threadpool(group_env_vars_by_section, homesentry_vars)
+        etag = compute_etag(grouped)
+        _config_cache = (etag, grouped)
         
-        return JSONResponse(content=grouped)
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return ORJSONResponse(content=grouped, headers={"ETag": etag})
     
     except Exception as e:
         logger.error(f"Error reading config: {e}", exc_info=True)
@@ -285,10 +422,24 @@ class ConfigUpdate(BaseModel):
     modules: Dict[str, Dict[str, Any]] = {}
     infrastructure: Dict[str, Any] = {}
     advanced: Dict[str, Any] = {}
+    
+    def sections(self) -> Dict[str, Any]:
+        """
+        Return the section dicts keyed by section name.
+        
+        Unlike .dict()/.model_dump() this does not deep-copy the nested
+        dicts; validation and .env writing only read them.
+        """
+        return {
+            "core": self.core,
+            "modules": self.modules,
+            "infrastructure": self.infrastructure,
+            "advanced": self.advanced,
+        }
 
 
 @router.post("/api/config")
-async def update_config(config: ConfigUpdate) -> JSONResponse:
+async def update_config(config: ConfigUpdate) -> ORJSONResponse:
     """
     Update configuration.
     
@@ -313,40 +464,33 @@ async def update_config(config: ConfigUpdate) -> JSONResponse:
         # Read current environment variables for preserving masked values
         current_env = dict(os.environ)
         
-        # Convert to dict for validation
-        config_dict = config.dict()
+        # Section dicts for validation (no copy)
+        config_dict = config.sections()
         
         # Validate configuration
-        is_valid, errors = validate_config(config_dict)
+        is_valid, errors = validate_config_cached(config_dict)
         if not is_valid:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"success": False, "errors": errors}
             )
         
-        # Build new .env content
-        env_content = build_env_content(config_dict, current_env)
-        
-        # Write atomically to .env file
+        # Write new .env content atomically (stream to tmp file, then rename).
+        # File I/O runs in the threadpool so the event loop keeps serving
+        # health checks and dashboard polls meanwhile.
         tmp_path = env_path.parent / ".env.tmp"
-        tmp_path.write_text(env_content)
-        tmp_path.rename(env_path)
+        new_env = await run_in_threadpool(write_env_content, config_dict, current_env, tmp_path)
+        await run_in_threadpool(replace_file, tmp_path, env_path)
         
         # Also update the current process environment variables
         # This makes changes take effect immediately without restart
-        # Parse the .env content we just wrote
-        new_env = {}
-        for line in env_content.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                new_env[key] = value
-                os.environ[key] = value
+        os.environ.update(new_env)
+        invalidate_config_cache()
         
-        logger.info(f"Configuration updated successfully at {env_path}")
-        logger.info(f"Updated {len(new_env)} environment variables in current process")
+        logger.info("Configuration updated successfully at %s", env_path)
+        logger.info("Updated %d environment variables in current process", len(new_env))
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "success": True,
             "path": str(env_path.absolute()),
             "message": "Configuration saved. Changes take effect immediately."
@@ -358,20 +502,20 @@ async def update_config(config: ConfigUpdate) -> JSONResponse:
 
 
 @router.post("/api/config/validate")
-async def validate_config_endpoint(config: ConfigUpdate) -> JSONResponse:
+async def validate_config_endpoint(config: ConfigUpdate) -> ORJSONResponse:
     """
     Validate configuration without saving.
     
     Returns validation results without writing to .env.
     """
     try:
-        config_dict = config.dict()
-        is_valid, errors = validate_config(config_dict)
+        config_dict = config.sections()
+        is_valid, errors = validate_config_cached(config_dict)
         
         if is_valid:
-            return JSONResponse(content={"valid": True})
+            return ORJSONResponse(content={"valid": True})
         else:
-            return JSONResponse(content={"valid": False, "errors": errors})
+            return ORJSONResponse(content={"valid": False, "errors": errors})
     
     except Exception as e:
         logger.error(f"Error validating config: {e}", exc_info=True)
@@ -379,12 +523,12 @@ async def validate_config_endpoint(config: ConfigUpdate) -> JSONResponse:
 
 
 @router.post("/api/config/restart")
-async def restart_container() -> JSONResponse:
+async def restart_container() -> ORJSONResponse:
     """
     Provide restart instructions.
     
     Returns command to restart the container (does not actually restart).
     """
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "message": "Restart required. Run: docker compose -f docker/docker-compose.yml restart homesentry"
     })
@@ -0,0 +1,27 @@
+"""
+HTTP caching helpers for HomeSentry's JSON endpoints
+
+Polled endpoints (dashboard metrics, chart catalogue, configuration) attach
+a weak ETag to their responses. A client that sends the ETag back in
+If-None-Match gets an empty 304 Not Modified instead of the same JSON again.
+"""
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request
+
+
+def compute_etag(content: Any) -> str:
+    """Build a weak ETag from the JSON-serialisable content of a response."""
+    digest = hashlib.sha1(orjson.dumps(content, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return f'W/"{digest[:16]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
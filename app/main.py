@@ -6,22 +6,36 @@ logging configuration, and CORS middleware.
 """
 import logging
 import os
+import re
+import time
 import asyncio
+import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Dict, Any, List
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from functools import lru_cache
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, Optional, Tuple
+import orjson
+from fastapi import BackgroundTasks, FastAPI, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from dotenv import load_dotenv
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from app.storage import (
+    DEFAULT_DATABASE_PATH,
     init_database,
-    get_latest_metrics,
-    get_latest_service_status,
+    flush_metric_samples,
+    get_latest_metrics_by_name,
+    get_latest_service_status_by_service,
     get_latest_events,
+    get_dashboard_data,
+    get_latest_snapshot,
     get_metric_history,
     get_available_chart_metrics,
 )
@@ -32,10 +46,14 @@ from app.collectors import (
     collect_all_smart_metrics,
     collect_all_raid_metrics,
     collect_all_app_metrics,
+    collect_app_metrics_for,
+    iter_app_metrics,
 )
-from app.collectors.modules import get_discovered_modules
-from app.scheduler import run_scheduler
+from app.collectors.modules import clear_module_cache, get_discovered_modules
+from app.scheduler import POLL_INTERVAL, get_collection_generation, run_scheduler
 from app.config.routes import router as config_router
+from app.http_cache import compute_etag, etag_matches
+from app.prometheus import CONTENT_TYPE as PROMETHEUS_CONTENT_TYPE, render_metrics
 from app.alerts import send_discord_webhook, format_service_alert
 from app.alerts.sleep_schedule import get_sleep_schedule, is_in_sleep_hours
 
@@ -50,51 +68,167 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Development mode: reload edited templates (and code, when run directly)
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
 # ---------------------------------------------------------------------------
 # Module-level constants used by dashboard metric parsing helpers
+# (immutable: tuples and read-only mappings, built once at import and shared
+# by every request)
 # ---------------------------------------------------------------------------
 
 # Known app module prefixes — used to group app metrics by module
-APP_PREFIXES = ["plex", "jellyfin", "pihole", "homeassistant", "qbittorrent"]
+APP_PREFIXES = ("plex", "jellyfin", "pihole", "homeassistant", "qbittorrent")
 
 # Human-friendly display names for each app module
-APP_DISPLAY_NAMES = {
+APP_DISPLAY_NAMES = MappingProxyType({
     "plex": "Plex",
     "jellyfin": "Jellyfin",
     "pihole": "Pi-hole",
     "homeassistant": "Home Assistant",
     "qbittorrent": "qBittorrent",
-}
+})
 
 # Which metrics to show on each app's dashboard card (priority order)
-APP_CARD_METRICS = {
-    "plex": ["active_streams", "transcode_count", "movie_count", "tv_show_count"],
-    "jellyfin": ["active_streams", "transcode_count", "movie_count", "episode_count"],
-    "pihole": ["percent_blocked", "queries_blocked_today", "active_clients", "blocklist_size"],
-    "homeassistant": ["entity_count", "automation_count", "response_time_ms"],
-    "qbittorrent": ["download_speed_mbps", "upload_speed_mbps", "active_torrents", "disk_free_gb"],
-}
+APP_CARD_METRICS = MappingProxyType({
+    "plex": ("active_streams", "transcode_count", "movie_count", "tv_show_count"),
+    "jellyfin": ("active_streams", "transcode_count", "movie_count", "episode_count"),
+    "pihole": ("percent_blocked", "queries_blocked_today", "active_clients", "blocklist_size"),
+    "homeassistant": ("entity_count", "automation_count", "response_time_ms"),
+    "qbittorrent": ("download_speed_mbps", "upload_speed_mbps", "active_torrents", "disk_free_gb"),
+})
+
+# Severity order used to bubble the worst metric status up to its entity
+STATUS_RANK = MappingProxyType({"OK": 0, "WARN": 1, "FAIL": 2})
 
 # Disk mount prefixes that represent container-internal paths, not real host disks
-SKIP_DISK_PREFIXES = ["disk_etc_", "disk_app_data_"]
+# (a tuple, so str.startswith can check them all in one call)
+SKIP_DISK_PREFIXES = ("disk_etc_", "disk_app_data_")
+
+# System metrics shown on the dashboard -> their key in the status dict
+SYSTEM_STATUS_KEYS = MappingProxyType({
+    "cpu_percent": "cpu",
+    "memory_percent": "memory",
+})
+
+# Slice bounds for the mountpoint in "disk_{mountpoint}_percent" names
+DISK_MOUNT_START = len("disk_")
+DISK_MOUNT_END = -len("_percent")
 
 # Known SMART metric suffixes — used to split "drive_{device}_{metric}" names
-SMART_METRIC_SUFFIXES = [
+SMART_METRIC_SUFFIXES = (
     "_health",
     "_temperature",
     "_reallocated_sectors",
     "_pending_sectors",
     "_power_on_hours",
-]
+)
 
 # Known RAID metric suffixes — used to split "array_{name}_{metric}" names
-RAID_METRIC_SUFFIXES = ["_health", "_active_disks", "_state", "_degraded"]
+RAID_METRIC_SUFFIXES = ("_health", "_active_disks", "_state", "_degraded")
+
+# Name dispatch patterns, compiled once from the lists above so each metric
+# name is classified with a single regex match instead of a Python loop over
+# prefixes/suffixes. None of the suffixes is a suffix of another, so at most
+# one alternative can match the end of a name.
+APP_METRIC_RE = re.compile(
+    r"^(" + "|".join(map(re.escape, APP_PREFIXES)) + r")_(.*)$", re.DOTALL
+)
+SMART_METRIC_RE = re.compile(
+    r"^drive_(.+?)(" + "|".join(map(re.escape, SMART_METRIC_SUFFIXES)) + r")$", re.DOTALL
+)
+RAID_METRIC_RE = re.compile(
+    r"^array_(.+?)(" + "|".join(map(re.escape, RAID_METRIC_SUFFIXES)) + r")$", re.DOTALL
+)
+# "container_{name}_{metric}": the metric type is the last underscore segment
+DOCKER_METRIC_RE = re.compile(r"^container_(.*)_([^_]*)$", re.DOTALL)
+
+# Metric category -> name pattern used by split_metric_name()
+METRIC_NAME_PATTERNS = MappingProxyType({
+    "app": APP_METRIC_RE,
+    "docker": DOCKER_METRIC_RE,
+    "smart": SMART_METRIC_RE,
+    "raid": RAID_METRIC_RE,
+})
+
+# Samples older than this are not "latest" for /api/metrics/latest.
+# Must comfortably exceed the slowest collector (SMART, every 10 minutes by default).
+LATEST_METRICS_MAX_AGE_MINUTES = 60
+
+# How long (seconds) polled JSON payloads are reused before being rebuilt.
+# Dashboard payloads are snapshots of the scheduler's last collection cycle:
+# they are rebuilt as soon as a new cycle completes, and the TTL is only a
+# fallback in case the scheduler stalls. The chartable-metric catalogue
+# changes only when a new disk/metric appears.
+DASHBOARD_CACHE_TTL = POLL_INTERVAL * 2
+CHART_METRICS_CACHE_TTL = 60.0
+
+# Cache-Control for ETag-validated JSON endpoints. Latest-metrics payloads
+# change every poll (and on manual collects), so browsers always revalidate;
+# the generation-keyed ETag makes an unchanged answer an empty 304.
+LATEST_METRICS_CACHE_CONTROL = "no-cache"
+CHART_METRICS_CACHE_CONTROL = "max-age=3600, must-revalidate"
+MODULES_CACHE_CONTROL = "max-age=60, must-revalidate"
+
+# Finished/running manual collection jobs kept for GET /api/collect/jobs/{job_id}
+# (oldest are dropped first)
+MAX_COLLECT_JOBS = 50
+
+# DISCORD_WEBHOOK_URL value shipped in .env.example (i.e. not configured yet)
+PLACEHOLDER_WEBHOOK_URL = "https://discord.com/api/webhooks/YOUR_WEBHOOK_HERE"
+
+# Static parts of the /api/test-alert embed, laid over format_service_alert()'s
+TEST_ALERT_EMBED = MappingProxyType({
+    "title": "🧪 Test Alert - HomeSentry",
+    "description": "If you can see this, Discord alerts are working correctly!",
+    # Plain dicts in a tuple: the embed is serialised with the stdlib json
+    # module, which rejects mapping proxies
+    "fields": (
+        {
+            "name": "Status",
+            "value": "✅ Configuration Valid",
+            "inline": True,
+        },
+        {
+            "name": "Webhook",
+            "value": "Connected Successfully",
+            "inline": True,
+        },
+    ),
+})
+
+# Environment variables echoed by /api/debug/sleep-schedule
+SLEEP_ENV_VARS = (
+    "SLEEP_SCHEDULE_ENABLED",
+    "SLEEP_SCHEDULE_START",
+    "SLEEP_SCHEDULE_END",
+    "SLEEP_SUMMARY_ENABLED",
+    "SLEEP_SUMMARY_TIME",
+    "SLEEP_ALLOW_CRITICAL_ALERTS",
+)
+
+# Fixed times /api/debug/sleep-schedule checks against the sleep schedule
+SLEEP_TEST_TIMES = (
+    datetime(2026, 1, 30, 3, 0),   # Middle of night
+    datetime(2026, 1, 30, 7, 30),  # End of sleep
+    datetime(2026, 1, 30, 8, 0),   # Morning
+)
+
+# /healthz body, encoded once (Docker's HEALTHCHECK polls it constantly)
+HEALTHZ_BODY = orjson.dumps({"status": "healthy"})
+
+# Response compression: smallest body worth compressing (bytes), gzip level
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 5
+
+# Media type for newline-delimited JSON (one object per line)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 # Display units for the metric history endpoint
-METRIC_HISTORY_UNITS = {
+METRIC_HISTORY_UNITS = MappingProxyType({
     "cpu_percent": "%",
     "memory_percent": "%",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Lifespan context manager (replaces deprecated @app.on_event handlers)
@@ -104,15 +238,39 @@ METRIC_HISTORY_UNITS = {
 scheduler_task = None
 
 
+async def _init_database_logged() -> None:
+    """Initialise the database, logging (not raising) any failure."""
+    try:
+        db_success = await init_database()
+        if db_success:
+            logger.info("Database initialized successfully ✓")
+        else:
+            logger.error("Database initialization failed - check logs above")
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {e}", exc_info=True)
+        # Don't crash - app can still serve endpoints
+
+
+async def _warm_templates() -> None:
+    """Compile the page templates so the first page load doesn't pay for it."""
+    try:
+        for template_name in ("dashboard.html", "config.html"):
+            await asyncio.to_thread(template_env.get_template, template_name)
+    except Exception as e:
+        logger.warning(f"Failed to pre-compile templates: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Manage application startup and shutdown within a single async context manager.
 
-    On startup: initialises the database, logs configuration, and launches the
-    background scheduler task.
+    On startup: initialises the database and pre-compiles page templates
+    (concurrently), logs configuration, and launches the background
+    scheduler task.
 
-    On shutdown: cancels the scheduler task and waits for it to finish cleanly.
+    On shutdown: cancels the scheduler task, waits for it to finish cleanly,
+    and flushes any buffered metric samples.
     """
     global scheduler_task
 
@@ -121,23 +279,18 @@ async def lifespan(app: FastAPI):
     logger.info("HomeSentry v0.9.0 starting up...")
     logger.info("=" * 60)
     logger.info(f"Log level: {LOG_LEVEL}")
-    logger.info(f"Database path: {os.getenv('DATABASE_PATH', '/app/data/homesentry.db')}")
-    logger.info(f"Poll interval: {os.getenv('POLL_INTERVAL', '60')}s")
+    logger.info(f"Database path: {os.getenv('DATABASE_PATH', DEFAULT_DATABASE_PATH)}")
+    logger.info(f"Poll interval: {POLL_INTERVAL}s")
 
-    # Initialize database
-    try:
-        db_success = await init_database()
-        if db_success:
-            logger.info("Database initialized successfully ✓")
-        else:
-            logger.error("Database initialization failed - check logs above")
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {e}", exc_info=True)
-        # Don't crash - app can still serve endpoints
+    # Initialize database and compile page templates concurrently
+    # (both helpers log their own failures, so neither cancels the other)
+    async with asyncio.TaskGroup() as startup:
+        startup.create_task(_init_database_logged())
+        startup.create_task(_warm_templates())
 
     # Check if Discord webhook is configured
     discord_webhook = os.getenv("DISCORD_WEBHOOK_URL")
-    if discord_webhook and discord_webhook != "https://discord.com/api/webhooks/YOUR_WEBHOOK_HERE":
+    if discord_webhook and discord_webhook != PLACEHOLDER_WEBHOOK_URL:
         logger.info("Discord webhook: configured ✓")
     else:
         logger.warning("Discord webhook: not configured (alerts disabled)")
@@ -169,6 +322,9 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("Scheduler cancelled ✓")
 
+    # Don't lose samples recorded by an interrupted cycle
+    await flush_metric_samples()
+
     logger.info("Shutdown complete")
 
 
@@ -183,6 +339,9 @@ app = FastAPI(
     docs_url="/docs",   # Swagger UI at /docs
     redoc_url="/redoc", # ReDoc at /redoc
     lifespan=lifespan,
+    # JSON endpoints serialise with orjson (much faster on the nested
+    # dicts of floats the dashboard polls); HTML routes set their own class
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS middleware (allow all origins for now - security comes in v1.0)
@@ -194,11 +353,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses of 1 KB or more for clients that accept gzip. The JSON
+# payloads repeat the same keys per item and shrink several-fold; a mid
+# compression level keeps the CPU cost per response small. (Streamed NDJSON
+# is compressed too, so clients that want lines immediately should not
+# send Accept-Encoding: gzip.)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_LEVEL)
+
 # Mount static files (CSS, JS, images)
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# Setup Jinja2 templates
-templates = Jinja2Templates(directory="app/templates")
+# Setup Jinja2 templates. Templates only change on deploy, so outside of
+# DEBUG mode Jinja doesn't re-stat the files on every render, and compiled
+# bytecode is cached on disk so a restart doesn't recompile them either.
+template_env = Environment(
+    loader=FileSystemLoader("app/templates"),
+    autoescape=True,
+    auto_reload=DEBUG,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+templates = Jinja2Templates(env=template_env)
+
+# Template globals instead of per-request context: the scheduler's poll
+# interval can't change without a restart, and the footer timestamp comes
+# from the per-second cache shared with the JSON endpoints
+template_env.globals["poll_interval"] = POLL_INTERVAL
+template_env.globals["last_updated"] = lambda: _now_strings()[1]
 
 # Mount config router
 app.include_router(config_router)
@@ -208,12 +388,264 @@ app.include_router(config_router)
 # Dashboard data processing helpers
 # ---------------------------------------------------------------------------
 
+async def _gather_queries(*queries) -> List[Any]:
+    """
+    Run independent database queries concurrently.
+
+    Each storage helper opens its own connection, so the queries can overlap
+    instead of paying one round-trip after another.  A query that raises is
+    logged and yields an empty list, so one failure doesn't blank the page.
+
+    Args:
+        *queries: Awaitables returning lists of rows
+
+    Returns:
+        List of results in the same order as ``queries``
+    """
+    results = await asyncio.gather(*queries, return_exceptions=True)
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.error(f"Dashboard query failed: {result}", exc_info=result)
+            results[i] = []
+    return results
+
+
+# Response cache for polled endpoints:
+# key -> (time.monotonic() when built, generation, ETag, payload)
+_response_cache: Dict[str, Tuple[float, Optional[int], str, Dict[str, Any]]] = {}
+_response_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def _cached_response(
+    key: str,
+    ttl: float,
+    build: Callable[[], Awaitable[Dict[str, Any]]],
+    generation: Optional[int] = None,
+) -> Tuple[Dict[str, Any], str]:
+    """
+    Return a payload built by ``build``, reusing it for ``ttl`` seconds.
+
+    Concurrent requests for an expired payload are coalesced: the first one
+    rebuilds it under a per-key lock while the others wait and then reuse
+    the fresh result, so N dashboard tabs cost one set of DB queries.
+    Payloads carrying an ``error`` key are returned but never cached.
+
+    Args:
+        key: Cache slot name (one per endpoint)
+        ttl: Maximum age of a cached payload in seconds
+        build: Coroutine function producing the payload
+        generation: Optional data version (e.g. get_collection_generation());
+            a cached payload built for a different generation is stale
+
+    Returns:
+        Tuple of (cached or freshly built payload, its ETag). The ETag is
+        computed once per build, not per request.
+    """
+    def fresh(entry: Optional[Tuple[float, Optional[int], str, Dict[str, Any]]]) -> bool:
+        return (
+            entry is not None
+            and entry[1] == generation
+            and time.monotonic() - entry[0] < ttl
+        )
+
+    cached = _response_cache.get(key)
+    if fresh(cached):
+        return cached[3], cached[2]
+
+    lock = _response_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another request may have rebuilt it while we waited for the lock
+        cached = _response_cache.get(key)
+        if fresh(cached):
+            return cached[3], cached[2]
+
+        payload = await build()
+        etag = compute_etag(payload)
+        if "error" not in payload:
+            _response_cache[key] = (time.monotonic(), generation, etag, payload)
+        return payload, etag
+
+
+async def _finish_manual_collection() -> None:
+    """Write a manual collection's buffered samples and drop cached payloads."""
+    await flush_metric_samples()
+    _response_cache.clear()
+
+
+@lru_cache(maxsize=64)
+def _parse_fields(fields: Optional[str]) -> Optional[frozenset]:
+    """
+    Parse a ``?fields=a,b`` query value into the set of keys to return.
+
+    Returns:
+        frozenset of field names, or None when no projection was requested
+    """
+    if not fields:
+        return None
+    wanted = frozenset(f.strip() for f in fields.split(",") if f.strip())
+    return wanted or None
+
+
+def _select_fields(payload: Dict[str, Any], wanted: Optional[frozenset]) -> Dict[str, Any]:
+    """
+    Restrict a response dict to the requested keys.
+
+    An ``error`` key is always kept so a projection can't hide a failure.
+    """
+    if wanted is None:
+        return payload
+    return {k: v for k, v in payload.items() if k in wanted or k == "error"}
+
+
+# Manual collection jobs started with ?background=true: job_id -> job record
+_collect_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _start_collect_job(
+    job_type: str,
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+    background_tasks: BackgroundTasks,
+) -> ORJSONResponse:
+    """
+    Queue a manual collection to run after the response is sent.
+
+    Args:
+        job_type: Which collection this is (e.g. "docker", "modules/plex")
+        run: Coroutine function performing the collection and returning
+            the payload the endpoint would otherwise have returned
+        background_tasks: The request's BackgroundTasks
+
+    Returns:
+        202 Accepted response carrying the job id to poll
+    """
+    job_id = uuid.uuid4().hex
+    job = {
+        "job_id": job_id,
+        "type": job_type,
+        "status": "pending",
+        "started": None,
+        "finished": None,
+        "result": None,
+        "error": None,
+    }
+    _collect_jobs[job_id] = job
+    while len(_collect_jobs) > MAX_COLLECT_JOBS:
+        _collect_jobs.popitem(last=False)
+
+    background_tasks.add_task(_run_collect_job, job, run)
+    return ORJSONResponse(
+        status_code=202,
+        content={
+            "job_id": job_id,
+            "status": "pending",
+            "status_url": f"/api/collect/jobs/{job_id}",
+        },
+    )
+
+
+async def _run_collect_job(
+    job: Dict[str, Any],
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+) -> None:
+    """Run a queued manual collection, recording its outcome in ``job``."""
+    job["status"] = "running"
+    job["started"] = _now_strings()[0]
+    try:
+        job["result"] = await run()
+        job["status"] = "completed"
+    except Exception as e:
+        logger.error(f"Manual collection job {job['job_id']} ({job['type']}) failed: {e}", exc_info=True)
+        job["status"] = "failed"
+        job["error"] = str(e)
+    job["finished"] = _now_strings()[0]
+
+
+async def _run_manual_collection(
+    job_type: str,
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+    background_tasks: BackgroundTasks,
+    background: bool,
+    fields: Optional[str],
+) -> Any:
+    """
+    Run a manual collection inline or as a background job.
+
+    Args:
+        job_type: Which collection this is (e.g. "docker", "modules/plex")
+        run: Coroutine function performing the collection and returning
+            the full response payload
+        background_tasks: The request's BackgroundTasks
+        background: Queue the collection and return a job id instead
+        fields: Optional ``?fields=`` value restricting the payload's keys
+
+    Returns:
+        The (projected) payload, or a 202 response when ``background`` is set
+    """
+    wanted = _parse_fields(fields)
+
+    async def collect() -> Dict[str, Any]:
+        return _select_fields(await run(), wanted)
+
+    if background:
+        return _start_collect_job(job_type, collect, background_tasks)
+    return await collect()
+
+
+# "Now" strings shared by every response within the same wall-clock second:
+# [epoch second, ISO-8601 timestamp, "YYYY-MM-DD HH:MM:SS" display string]
+_now_strings_cache: List[Any] = [0, "", ""]
+
+
+def _now_strings() -> Tuple[str, str]:
+    """
+    Get the current time formatted for API responses and page rendering.
+
+    Formatting is redone at most once per second, so bursts of polling
+    requests (several tabs, coalesced cache hits) share the same strings.
+
+    Returns:
+        Tuple of (ISO-8601 timestamp, "YYYY-MM-DD HH:MM:SS" display string)
+    """
+    second = int(time.time())
+    if second != _now_strings_cache[0]:
+        now = datetime.now()
+        _now_strings_cache[:] = [second, now.isoformat(), now.isoformat(sep=" ", timespec="seconds")]
+    return _now_strings_cache[1], _now_strings_cache[2]
+
+
+@lru_cache(maxsize=4096)
+def split_metric_name(category: str, name: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a metric name into its (entity, metric type) parts.
+
+    The set of metric names is small and stable (one per app metric,
+    container metric, drive attribute, ...), so results are memoized:
+    after the first snapshot every split is a cache hit rather than a
+    regex match.
+
+    Args:
+        category: Metric category ("app", "docker", "smart" or "raid")
+        name: Metric name, e.g. "container_jellyfin_status"
+
+    Returns:
+        The two groups of the category's pattern, e.g. ("jellyfin", "status");
+        SMART/RAID types keep their leading underscore ("_health"). None if
+        the name doesn't match or the category has no pattern.
+    """
+    pattern = METRIC_NAME_PATTERNS.get(category)
+    if pattern is None:
+        return None
+    match = pattern.match(name)
+    return match.groups() if match else None
+
+
 def process_system_status(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Extract latest system metrics for dashboard display.
 
     Args:
-        metrics: List of metric samples from database
+        metrics: Metric samples with one row per name, e.g. from
+            get_latest_metrics_by_name()
 
     Returns:
         Dict with processed system status (CPU, memory, disk)
@@ -225,38 +657,34 @@ def process_system_status(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
     for metric in metrics:
-        if metric["category"] == "system":
-            if "cpu_percent" in metric["name"]:
-                status["cpu"] = {
-                    "value": f"{metric['value_num']:.1f}%",
-                    "status": metric["status"]
-                }
-            elif "memory_percent" in metric["name"]:
-                status["memory"] = {
-                    "value": f"{metric['value_num']:.1f}%",
+        name = metric["name"]
+        category = metric["category"]
+
+        if category == "system":
+            # CPU/memory: one hash lookup on the exact metric name
+            status_key = SYSTEM_STATUS_KEYS.get(name)
+            if status_key is not None:
+                status[status_key] = {
+                    "value": "%.1f%%" % metric["value_num"],
                     "status": metric["status"]
                 }
-        elif metric["category"] == "disk":
+        elif category == "disk":
             # Only process _percent metrics (skip _free_gb to avoid displaying raw GB as %)
-            if not metric["name"].endswith("_percent"):
+            if not name.endswith("_percent"):
                 continue
 
             # Skip container-internal volume mounts that aren't real disks
             # These are Docker bind mounts like /etc/resolv.conf, /etc/hostname, etc.
-            if any(metric["name"].startswith(p) for p in SKIP_DISK_PREFIXES):
+            if name.startswith(SKIP_DISK_PREFIXES):
                 continue
 
             # Extract mountpoint from name like "disk_host_mnt_Array_percent"
             # Strip "disk_" prefix and "_percent" suffix
-            mountpoint = metric["name"][len("disk_"):-len("_percent")]
-
-            # Dedupe: only keep the first (latest) entry per mountpoint
-            if any(d["mountpoint"] == mountpoint for d in status["disk"]):
-                continue
+            mountpoint = name[DISK_MOUNT_START:DISK_MOUNT_END]
 
             status["disk"].append({
                 "mountpoint": mountpoint,
-                "value": f"{metric['value_num']:.1f}%",
+                "value": "%.1f%%" % metric["value_num"],
                 "status": metric["status"]
             })
 
@@ -268,26 +696,30 @@ def process_service_status(services: List[Dict[str, Any]]) -> Dict[str, Dict[str
     Extract latest service status for dashboard display.
 
     Args:
-        services: List of service status checks from database
+        services: Latest status check of each service, from
+            get_latest_service_status_by_service()
 
     Returns:
         Dict mapping service names to their latest status
     """
-    status = {}
-
-    # Get the latest status for each unique service
-    seen_services = set()
-    for service in services:
-        service_name = service["service"]
-        if service_name not in seen_services:
-            status[service_name] = {
-                "status": service["status"],
-                "response_ms": service["response_ms"],
-                "http_code": service["http_code"]
-            }
-            seen_services.add(service_name)
+    return {
+        service["service"]: {
+            "status": service["status"],
+            "response_ms": service["response_ms"],
+            "http_code": service["http_code"]
+        }
+        for service in services
+    }
 
-    return status
+
+def _bubble_status(entry: Dict[str, Any], metric_status: str) -> None:
+    """
+    Raise an app/container/drive/array entry's status to a metric's, if worse.
+
+    Status order: OK < WARN < FAIL; other metric statuses leave it unchanged.
+    """
+    if STATUS_RANK.get(metric_status, 0) > STATUS_RANK[entry["status"]]:
+        entry["status"] = metric_status
 
 
 def _parse_app_metrics(
@@ -296,64 +728,49 @@ def _parse_app_metrics(
     """
     Group raw app metrics (category='app') by module prefix.
 
-    Iterates ``app_metrics_raw``, deduplicates by metric name (keeping the
-    first/latest sample), matches each name against ``APP_PREFIXES``, and
+    Iterates ``app_metrics_raw`` (already one latest row per metric name),
+    matches each name against ``APP_METRIC_RE``, and
     builds a dict keyed by module name.  The worst status across a module's
     metrics is bubbled up to the module-level ``status`` field.
 
     Args:
-        app_metrics_raw: Rows from get_latest_metrics(category='app').
+        app_metrics_raw: Rows from get_latest_metrics_by_name() with category='app'.
 
     Returns:
         Dict mapping module name -> module data dict (name, display_name,
         status, metrics, card_metrics).
     """
     apps: Dict[str, Any] = {}
-    seen_metrics: set = set()
 
     for metric in app_metrics_raw:
         name = metric["name"]
-        if name in seen_metrics:
-            continue  # Already have the latest sample for this metric
-        seen_metrics.add(name)
-
-        # Determine which app this metric belongs to by matching prefix
-        matched_app = None
-        for prefix in APP_PREFIXES:
-            if name.startswith(f"{prefix}_"):
-                matched_app = prefix
-                break
-
-        if not matched_app:
+
+        # Determine which app this metric belongs to by matching prefix;
+        # the rest of the name is the bare metric name
+        # e.g., "plex_active_streams" -> ("plex", "active_streams")
+        parts = split_metric_name("app", name)
+        if parts is None:
             continue  # Skip metrics with unknown prefix
+        matched_app, bare_name = parts
 
         # Initialize app entry if first metric for this app
-        if matched_app not in apps:
-            apps[matched_app] = {
+        app_entry = apps.get(matched_app)
+        if app_entry is None:
+            app_entry = apps[matched_app] = {
                 "name": matched_app,
                 "display_name": APP_DISPLAY_NAMES.get(matched_app, matched_app),
                 "status": "OK",
                 "metrics": {},
-                "card_metrics": APP_CARD_METRICS.get(matched_app, []),
+                "card_metrics": APP_CARD_METRICS.get(matched_app, ()),
             }
 
-        # Strip the app prefix to get the bare metric name
-        # e.g., "plex_active_streams" -> "active_streams"
-        bare_name = name[len(matched_app) + 1:]
-
-        apps[matched_app]["metrics"][bare_name] = {
+        app_entry["metrics"][bare_name] = {
             "value": metric["value_num"] if metric["value_num"] is not None else metric["value_text"],
             "status": metric["status"],
             "ts": metric["ts"],
         }
 
-        # Bubble up worst status: OK < WARN < FAIL
-        current_app_status = apps[matched_app]["status"]
-        metric_status = metric["status"]
-        if metric_status == "FAIL":
-            apps[matched_app]["status"] = "FAIL"
-        elif metric_status == "WARN" and current_app_status != "FAIL":
-            apps[matched_app]["status"] = "WARN"
+        _bubble_status(app_entry, metric["status"])
 
     return apps
 
@@ -368,57 +785,46 @@ def _parse_docker_metrics(infra_raw: List[Dict[str, Any]]) -> List[Dict[str, Any
     container's overall status field.
 
     Args:
-        infra_raw: Rows from get_latest_metrics(limit=200).
+        infra_raw: Rows from get_latest_metrics_by_name(); rows of other
+            categories are skipped.
 
     Returns:
         List of container dicts, one per discovered container.
     """
     docker_containers: Dict[str, Any] = {}
-    seen_docker: set = set()
 
     for metric in infra_raw:
         if metric["category"] != "docker":
             continue
 
         name = metric["name"]
-        if name in seen_docker:
-            continue
-        seen_docker.add(name)
-
-        # Strip "container_" prefix, then split off the last segment as metric_type
-        # e.g., "container_jellyfin_status" -> remainder="jellyfin_status"
-        if not name.startswith("container_"):
-            continue
-        remainder = name[len("container_"):]
 
-        # The metric type is the last underscore segment (e.g., "status")
-        last_underscore = remainder.rfind("_")
-        if last_underscore == -1:
+        # Split off the last underscore segment as metric_type
+        # e.g., "container_jellyfin_status" -> ("jellyfin", "status")
+        parts = split_metric_name("docker", name)
+        if parts is None:
             continue
-        container = remainder[:last_underscore]
-        metric_type = remainder[last_underscore + 1:]
+        container, metric_type = parts
 
-        if container not in docker_containers:
-            docker_containers[container] = {"name": container, "status": "OK"}
+        entry = docker_containers.get(container)
+        if entry is None:
+            entry = docker_containers[container] = {"name": container, "status": "OK"}
 
         # The "status" metric is special: value_num 1.0 = running, 0 = stopped.
         # Don't store the raw number — convert to a display string and use it
         # to set the container's overall status instead.
         if metric_type == "status":
             is_running = metric["value_num"] == 1.0 if metric["value_num"] is not None else False
-            docker_containers[container]["health"] = "Running" if is_running else "Stopped"
+            entry["health"] = "Running" if is_running else "Stopped"
             if not is_running:
-                docker_containers[container]["status"] = "FAIL"
+                entry["status"] = "FAIL"
         else:
-            docker_containers[container][metric_type] = (
+            entry[metric_type] = (
                 metric["value_num"] if metric["value_num"] is not None else metric["value_text"]
             )
 
         # Bubble up worst status from the metric's own status field
-        if metric["status"] == "FAIL":
-            docker_containers[container]["status"] = "FAIL"
-        elif metric["status"] == "WARN" and docker_containers[container]["status"] != "FAIL":
-            docker_containers[container]["status"] = "WARN"
+        _bubble_status(entry, metric["status"])
 
     return list(docker_containers.values())
 
@@ -427,52 +833,41 @@ def _parse_smart_metrics(infra_raw: List[Dict[str, Any]]) -> List[Dict[str, Any]
     """
     Extract SMART drive metrics from raw infrastructure metric rows.
 
-    Parses names matching "drive_{device}_{metric}" using ``SMART_METRIC_SUFFIXES``
+    Parses names matching "drive_{device}_{metric}" using ``SMART_METRIC_RE``
     to split the device path from the metric type.  The ``health`` metric
     (1.0 = PASSED, 0.0 = FAILED) is converted to a human-readable string.
     Bogus ``power_on_hours`` values over 200,000 are suppressed.
 
     Args:
-        infra_raw: Rows from get_latest_metrics(limit=200).
+        infra_raw: Rows from get_latest_metrics_by_name(); rows of other
+            categories are skipped.
 
     Returns:
         List of drive dicts, one per discovered drive.
     """
     smart_drives: Dict[str, Any] = {}
-    seen_smart: set = set()
 
     for metric in infra_raw:
         if metric["category"] != "smart":
             continue
 
         name = metric["name"]
-        if name in seen_smart:
-            continue
-        seen_smart.add(name)
-
-        if not name.startswith("drive_"):
-            continue
 
         # Match against known suffixes to extract drive identity and metric type
-        drive = None
-        metric_type = None
-        for suffix in SMART_METRIC_SUFFIXES:
-            if name.endswith(suffix):
-                # Everything between "drive_" and the suffix is the drive identifier
-                drive = name[len("drive_"):-len(suffix)]
-                metric_type = suffix[1:]  # strip leading underscore
-                break
-
-        if not drive or not metric_type:
+        # (everything between "drive_" and the suffix is the drive identifier)
+        parts = split_metric_name("smart", name)
+        if parts is None:
             continue
-
-        # Clean up the drive name for display: "__dev_sda" -> "/dev/sda"
-        display_name = (
-            drive.replace("__", "/").replace("_", "/") if drive.startswith("_") else drive
-        )
-
-        if drive not in smart_drives:
-            smart_drives[drive] = {"name": display_name, "status": "OK"}
+        drive, suffix = parts
+        metric_type = suffix[1:]  # strip leading underscore
+
+        entry = smart_drives.get(drive)
+        if entry is None:
+            # Clean up the drive name for display: "__dev_sda" -> "/dev/sda"
+            display_name = (
+                drive.replace("__", "/").replace("_", "/") if drive.startswith("_") else drive
+            )
+            entry = smart_drives[drive] = {"name": display_name, "status": "OK"}
 
         value = metric["value_num"] if metric["value_num"] is not None else metric["value_text"]
 
@@ -485,11 +880,8 @@ def _parse_smart_metrics(infra_raw: List[Dict[str, Any]]) -> List[Dict[str, Any]
         if metric_type == "health":
             value = "PASSED" if value == 1.0 else "FAILED"
 
-        smart_drives[drive][metric_type] = value
-        if metric["status"] == "FAIL":
-            smart_drives[drive]["status"] = "FAIL"
-        elif metric["status"] == "WARN" and smart_drives[drive]["status"] != "FAIL":
-            smart_drives[drive]["status"] = "WARN"
+        entry[metric_type] = value
+        _bubble_status(entry, metric["status"])
 
     return list(smart_drives.values())
 
@@ -498,45 +890,35 @@ def _parse_raid_metrics(infra_raw: List[Dict[str, Any]]) -> List[Dict[str, Any]]
     """
     Extract RAID array metrics from raw infrastructure metric rows.
 
-    Parses names matching "array_{name}_{metric}" using ``RAID_METRIC_SUFFIXES``
+    Parses names matching "array_{name}_{metric}" using ``RAID_METRIC_RE``
     to split the array name from the metric type.  The ``health`` metric
     (1.0 = Healthy, 0.0 = Degraded) is converted to a human-readable string.
 
     Args:
-        infra_raw: Rows from get_latest_metrics(limit=200).
+        infra_raw: Rows from get_latest_metrics_by_name(); rows of other
+            categories are skipped.
 
     Returns:
         List of array dicts, one per discovered RAID array.
     """
     raid_arrays: Dict[str, Any] = {}
-    seen_raid: set = set()
 
     for metric in infra_raw:
         if metric["category"] != "raid":
             continue
 
         name = metric["name"]
-        if name in seen_raid:
-            continue
-        seen_raid.add(name)
-
-        if not name.startswith("array_"):
-            continue
 
         # Match against known suffixes
-        array = None
-        metric_type = None
-        for suffix in RAID_METRIC_SUFFIXES:
-            if name.endswith(suffix):
-                array = name[len("array_"):-len(suffix)]
-                metric_type = suffix[1:]  # strip leading underscore
-                break
-
-        if not array or not metric_type:
+        parts = split_metric_name("raid", name)
+        if parts is None:
             continue
+        array, suffix = parts
+        metric_type = suffix[1:]  # strip leading underscore
 
-        if array not in raid_arrays:
-            raid_arrays[array] = {"name": array, "status": "OK"}
+        entry = raid_arrays.get(array)
+        if entry is None:
+            entry = raid_arrays[array] = {"name": array, "status": "OK"}
 
         value = metric["value_num"] if metric["value_num"] is not None else metric["value_text"]
 
@@ -544,11 +926,8 @@ def _parse_raid_metrics(infra_raw: List[Dict[str, Any]]) -> List[Dict[str, Any]]
         if metric_type == "health":
             value = "Healthy" if value == 1.0 else "Degraded"
 
-        raid_arrays[array][metric_type] = value
-        if metric["status"] == "FAIL":
-            raid_arrays[array]["status"] = "FAIL"
-        elif metric["status"] == "WARN" and raid_arrays[array]["status"] != "FAIL":
-            raid_arrays[array]["status"] = "WARN"
+        entry[metric_type] = value
+        _bubble_status(entry, metric["status"])
 
     return list(raid_arrays.values())
 
@@ -572,47 +951,36 @@ async def dashboard(request: Request):
     Returns:
         HTMLResponse: Rendered dashboard HTML
     """
-    # Get poll interval for display
-    poll_interval = os.getenv("POLL_INTERVAL", "60")
-
-    # Query latest data from database
-    try:
-        # Get latest metrics (last 20 to find most recent of each type)
-        latest_metrics_raw = await get_latest_metrics(limit=20)
-
-        # Get latest service status (last 20 to find most recent of each service)
-        latest_services_raw = await get_latest_service_status(limit=20)
-
-        # Get recent events for alerts section
-        recent_events = await get_latest_events(limit=20)
-
-    except Exception as e:
-        logger.error(f"Dashboard data query failed: {e}", exc_info=True)
-        # Provide empty data on error - dashboard will show "no data" state
-        latest_metrics_raw = []
-        latest_services_raw = []
-        recent_events = []
+    # Query latest data from database: most recent sample of each metric,
+    # most recent check of each service, and recent events for the alerts
+    # section, all over one connection. A failed read yields empty data -
+    # dashboard will show its "no data" state.
+    latest_metrics_raw, latest_services_raw, recent_events = await get_dashboard_data(
+        max_age_minutes=LATEST_METRICS_MAX_AGE_MINUTES,
+        event_limit=20,
+    )
 
     # Process data for dashboard display
     system_status = process_system_status(latest_metrics_raw)
     service_status = process_service_status(latest_services_raw)
 
     # Limit metrics displayed in the table to 10 most recent
-    latest_metrics = latest_metrics_raw[:10] if latest_metrics_raw else []
+    latest_metrics = latest_metrics_raw[:10]
 
-    # Render dashboard template
-    return templates.TemplateResponse(
-        "dashboard.html",
+    # Render dashboard template in a worker thread: rendering is pure CPU
+    # work and would otherwise hold up every other request on the loop
+    template = template_env.get_template("dashboard.html")
+    html = await asyncio.to_thread(
+        template.render,
         {
             "request": request,
             "system_status": system_status,
             "service_status": service_status,
             "latest_metrics": latest_metrics,
             "recent_events": recent_events,
-            "poll_interval": poll_interval,
-            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
     )
+    return HTMLResponse(html)
 
 
 @app.get("/config", response_class=HTMLResponse)
@@ -638,7 +1006,7 @@ async def config_page(request: Request):
 
 
 @app.get("/api/metrics/latest")
-async def get_latest_dashboard_metrics():
+async def get_latest_dashboard_metrics(request: Request, response: Response):
     """
     Get the latest metrics for both Application Layer and Infrastructure Layer.
 
@@ -650,26 +1018,56 @@ async def get_latest_dashboard_metrics():
     grouped by the app prefix in the metric name (e.g., 'plex_active_streams'
     groups under 'plex').
 
+    The payload is built once per scheduler collection cycle and served from
+    memory until the next cycle completes; only ``timestamp`` is per request.
+    The ETag identifies the snapshot, so a client that already has it gets
+    an empty 304 Not Modified.
+
     Returns:
         dict with keys: apps, system, docker, smart, raid, services, timestamp
     """
+    payload, etag = await _cached_response(
+        "metrics_latest",
+        DASHBOARD_CACHE_TTL,
+        _build_latest_dashboard_metrics,
+        generation=get_collection_generation(),
+    )
+    headers = {"ETag": etag, "Cache-Control": LATEST_METRICS_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return {**payload, "timestamp": _now_strings()[0]}
+
+
+async def _build_latest_dashboard_metrics() -> Dict[str, Any]:
+    """Build the /api/metrics/latest payload (see get_latest_dashboard_metrics)."""
     try:
-        # Fetch app metrics (category='app')
-        app_metrics_raw = await get_latest_metrics(category="app", limit=100)
-
-        # Fetch infrastructure metrics.
-        # ~47 distinct metric names across system/disk/docker/smart/raid categories,
-        # so 200 rows gives comfortable headroom even if multiple samples per name appear.
-        infra_metrics_raw = await get_latest_metrics(limit=200)
-        latest_services_raw = await get_latest_service_status(limit=20)
-
-        # Parse each infrastructure layer via dedicated helpers
-        apps = _parse_app_metrics(app_metrics_raw)
-        system_status = process_system_status(infra_metrics_raw)
+        # Fetch the newest sample of every metric (one row per name, all
+        # categories) and the latest service checks concurrently
+        latest_raw, latest_services_raw = await _gather_queries(
+            get_latest_metrics_by_name(max_age_minutes=LATEST_METRICS_MAX_AGE_MINUTES),
+            get_latest_service_status_by_service(),
+        )
+
+        # Partition rows by category in a single pass, so each helper below
+        # only walks its own rows instead of filtering the whole list
+        by_category: Dict[str, List[Dict[str, Any]]] = {}
+        for metric in latest_raw:
+            rows = by_category.get(metric["category"])
+            if rows is None:
+                by_category[metric["category"]] = [metric]
+            else:
+                rows.append(metric)
+
+        # Parse each layer via dedicated helpers
+        apps = _parse_app_metrics(by_category.get("app", []))
+        system_status = process_system_status(
+            by_category.get("system", []) + by_category.get("disk", [])
+        )
         service_status = process_service_status(latest_services_raw)
-        docker = _parse_docker_metrics(infra_metrics_raw)
-        smart = _parse_smart_metrics(infra_metrics_raw)
-        raid = _parse_raid_metrics(infra_metrics_raw)
+        docker = _parse_docker_metrics(by_category.get("docker", []))
+        smart = _parse_smart_metrics(by_category.get("smart", []))
+        raid = _parse_raid_metrics(by_category.get("raid", []))
 
         return {
             "apps": apps,
@@ -678,7 +1076,7 @@ async def get_latest_dashboard_metrics():
             "smart": smart,
             "raid": raid,
             "services": service_status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_strings()[0],
         }
 
     except Exception as e:
@@ -694,13 +1092,13 @@ async def get_latest_dashboard_metrics():
             "smart": [],
             "raid": [],
             "services": {},
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_strings()[0],
             "error": str(e),
         }
 
 
 @app.get("/api/metrics/history/available")
-async def get_chartable_metrics():
+async def get_chartable_metrics(request: Request, response: Response):
     """
     Return the list of metrics that have historical data available for charting.
 
@@ -722,7 +1120,22 @@ async def get_chartable_metrics():
                 {"name": "disk_/mnt/Array_free_gb","label": "Disk Free (/mnt/Array)", "unit": "GB"}
             ]
         }
+
+    The list is cached for ``CHART_METRICS_CACHE_TTL`` seconds and carries
+    an ETag; a matching If-None-Match gets an empty 304 Not Modified.
     """
+    payload, etag = await _cached_response(
+        "chart_metrics", CHART_METRICS_CACHE_TTL, _build_chartable_metrics
+    )
+    headers = {"ETag": etag, "Cache-Control": CHART_METRICS_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
+
+
+async def _build_chartable_metrics() -> Dict[str, Any]:
+    """Build the /api/metrics/history/available payload."""
     try:
         metrics = await get_available_chart_metrics()
         return {"metrics": metrics}
@@ -779,8 +1192,13 @@ async def get_metric_history_endpoint(metric: str, hours: int = 24):
 
     try:
         rows = await get_metric_history(metric, hours=hours, bucket_count=bucket_count)
-        labels = [r["ts"] for r in rows]
-        values = [r["value"] for r in rows]
+        # One pass over the rows builds both parallel arrays
+        labels: List[str] = []
+        values: List[Any] = []
+        append_label, append_value = labels.append, values.append
+        for row in rows:
+            append_label(row["ts"])
+            append_value(row["value"])
 
         return {
             "metric": metric,
@@ -805,19 +1223,41 @@ async def get_metric_history_endpoint(metric: str, hours: int = 24):
 
 
 @app.get("/api/dashboard/status")
-async def dashboard_status_api():
+async def dashboard_status_api(request: Request, response: Response):
     """
     Get current system and service status as JSON.
 
     This API endpoint provides the same data as the visual dashboard but in JSON format,
     useful for programmatic access or building custom dashboards.
 
+    The status is built once per scheduler collection cycle and served from
+    memory until the next cycle completes; only ``timestamp`` is per request.
+    Like /api/metrics/latest it carries an ETag for the snapshot, so a
+    client that already has it gets an empty 304 Not Modified.
+
     Returns:
         dict: Current status of all monitored systems and services
     """
+    payload, etag = await _cached_response(
+        "dashboard_status",
+        DASHBOARD_CACHE_TTL,
+        _build_dashboard_status,
+        generation=get_collection_generation(),
+    )
+    headers = {"ETag": etag, "Cache-Control": LATEST_METRICS_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return {**payload, "timestamp": _now_strings()[0]}
+
+
+async def _build_dashboard_status() -> Dict[str, Any]:
+    """Build the /api/dashboard/status payload."""
     try:
-        latest_metrics_raw = await get_latest_metrics(limit=20)
-        latest_services_raw = await get_latest_service_status(limit=20)
+        latest_metrics_raw, latest_services_raw = await _gather_queries(
+            get_latest_metrics_by_name(max_age_minutes=LATEST_METRICS_MAX_AGE_MINUTES),
+            get_latest_service_status_by_service(),
+        )
 
         system_status = process_system_status(latest_metrics_raw)
         service_status = process_service_status(latest_services_raw)
@@ -825,7 +1265,7 @@ async def dashboard_status_api():
         return {
             "system": system_status,
             "services": service_status,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_strings()[0]
         }
 
     except Exception as e:
@@ -838,7 +1278,7 @@ async def dashboard_status_api():
                 "disk": [],
             },
             "services": {},
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_strings()[0]
         }
 
 
@@ -863,7 +1303,7 @@ async def dashboard_events_api(limit: int = 20):
         return {
             "events": recent_events,
             "count": len(recent_events),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_strings()[0]
         }
 
     except Exception as e:
@@ -872,7 +1312,7 @@ async def dashboard_events_api(limit: int = 20):
             "error": "Failed to retrieve events",
             "events": [],
             "count": 0,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_strings()[0]
         }
 
 
@@ -886,32 +1326,86 @@ async def health_check():
     application is running correctly.
 
     Returns:
-        dict: Simple health status
+        Response: Simple health status ({"status": "healthy"}), pre-encoded
+    """
+    return Response(content=HEALTHZ_BODY, media_type="application/json")
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """
+    Expose the latest metrics and service checks for Prometheus to scrape.
+
+    Serves the newest sample of every metric the scheduler has collected,
+    rendered once per collection cycle; scraping never triggers a
+    collection (use /api/collect/* for that).
+
+    Returns:
+        Response: Prometheus text exposition format, or 503 if the database
+        can't be read (so the scrape fails instead of reporting no series)
     """
-    return {"status": "healthy"}
+    payload, _ = await _cached_response(
+        "prometheus_metrics",
+        DASHBOARD_CACHE_TTL,
+        _build_prometheus_metrics,
+        generation=get_collection_generation(),
+    )
+    if "error" in payload:
+        return Response(
+            content=payload["error"] + "\n",
+            status_code=503,
+            media_type="text/plain",
+        )
+    return Response(content=payload["text"], media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+async def _build_prometheus_metrics() -> Dict[str, Any]:
+    """Build the /metrics exposition text (an "error" payload is not cached)."""
+    snapshot = await get_latest_snapshot(max_age_minutes=LATEST_METRICS_MAX_AGE_MINUTES)
+    if snapshot is None:
+        return {"error": "Failed to read metrics from the database"}
+    latest_metrics_raw, latest_services_raw = snapshot
+    return {"text": render_metrics(latest_metrics_raw, latest_services_raw)}
 
 
 @app.get("/api/collect/system")
-async def manual_collect_system():
+async def manual_collect_system(
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    fields: Optional[str] = None,
+):
     """
     Manually trigger system metrics collection (for testing).
 
     Collects CPU, memory, and disk metrics and writes them to the database.
     Useful for testing the system collector before scheduling is implemented.
 
+    Pass ``?background=true`` to return 202 with a job id immediately and
+    poll ``/api/collect/jobs/{job_id}`` for the results, and
+    ``?fields=message`` to skip the per-metric ``results``.
+
     Returns:
         dict: Collection results with all metrics and status
     """
     logger.info("Manual system metrics collection triggered via API")
-    results = await collect_all_system_metrics()
-    return {
-        "message": "System metrics collected successfully",
-        "results": results,
-    }
+
+    async def run() -> Dict[str, Any]:
+        results = await collect_all_system_metrics()
+        await _finish_manual_collection()
+        return {
+            "message": "System metrics collected successfully",
+            "results": results,
+        }
+
+    return await _run_manual_collection("system", run, background_tasks, background, fields)
 
 
 @app.get("/api/collect/services")
-async def manual_collect_services():
+async def manual_collect_services(
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    fields: Optional[str] = None,
+):
     """
     Manually trigger service health checks (for testing).
 
@@ -919,19 +1413,32 @@ async def manual_collect_services():
     measures response times, and writes results to the database.
     Useful for testing the service collector before scheduling is implemented.
 
+    Pass ``?background=true`` to return 202 with a job id immediately and
+    poll ``/api/collect/jobs/{job_id}`` for the results, and
+    ``?fields=results`` to return just the health check results.
+
     Returns:
         dict: Collection results with all service check results and status
     """
     logger.info("Manual service health checks triggered via API")
-    results = await check_all_services()
-    return {
-        "message": "Service checks completed",
-        "results": results,
-    }
+
+    async def run() -> Dict[str, Any]:
+        results = await check_all_services()
+        await _finish_manual_collection()
+        return {
+            "message": "Service checks completed",
+            "results": results,
+        }
+
+    return await _run_manual_collection("services", run, background_tasks, background, fields)
 
 
 @app.get("/api/collect/docker")
-async def manual_collect_docker():
+async def manual_collect_docker(
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    fields: Optional[str] = None,
+):
     """
     Manually trigger Docker container metrics collection (for testing).
 
@@ -939,19 +1446,32 @@ async def manual_collect_docker():
     for all Docker containers on the host system. Writes results to the database.
     Useful for testing the Docker collector before scheduling is implemented.
 
+    Pass ``?background=true`` to return 202 with a job id immediately and
+    poll ``/api/collect/jobs/{job_id}`` for the results, and
+    ``?fields=message`` to leave out the per-container ``results``.
+
     Returns:
         dict: Collection results with all container metrics and status
     """
     logger.info("Manual Docker metrics collection triggered via API")
-    results = await collect_all_docker_metrics()
-    return {
-        "message": "Docker metrics collected successfully",
-        "results": results,
-    }
+
+    async def run() -> Dict[str, Any]:
+        results = await collect_all_docker_metrics()
+        await _finish_manual_collection()
+        return {
+            "message": "Docker metrics collected successfully",
+            "results": results,
+        }
+
+    return await _run_manual_collection("docker", run, background_tasks, background, fields)
 
 
 @app.get("/api/collect/smart")
-async def manual_collect_smart():
+async def manual_collect_smart(
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    fields: Optional[str] = None,
+):
     """
     Manually trigger SMART drive health metrics collection (for testing).
 
@@ -960,19 +1480,32 @@ async def manual_collect_smart():
     drives. Writes results to the database.
     Useful for testing the SMART collector before scheduling is implemented.
 
+    Pass ``?background=true`` to return 202 with a job id immediately and
+    poll ``/api/collect/jobs/{job_id}`` for the results, and
+    ``?fields=message`` to omit the per-drive ``results``.
+
     Returns:
         dict: Collection results with all drive SMART metrics and status
     """
     logger.info("Manual SMART metrics collection triggered via API")
-    results = await collect_all_smart_metrics()
-    return {
-        "message": "SMART metrics collected successfully",
-        "results": results,
-    }
+
+    async def run() -> Dict[str, Any]:
+        results = await collect_all_smart_metrics()
+        await _finish_manual_collection()
+        return {
+            "message": "SMART metrics collected successfully",
+            "results": results,
+        }
+
+    return await _run_manual_collection("smart", run, background_tasks, background, fields)
 
 
 @app.get("/api/collect/raid")
-async def manual_collect_raid():
+async def manual_collect_raid(
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    fields: Optional[str] = None,
+):
     """
     Manually trigger RAID array metrics collection (for testing).
 
@@ -980,19 +1513,121 @@ async def manual_collect_raid():
     configured mdadm arrays. Writes results to the database.
     Useful for testing the RAID collector before scheduling is implemented.
 
+    Pass ``?background=true`` to return 202 with a job id immediately and
+    poll ``/api/collect/jobs/{job_id}`` for the results, and
+    ``?fields=results`` to return only the array results.
+
     Returns:
         dict: Collection results with all RAID array metrics and status
     """
     logger.info("Manual RAID metrics collection triggered via API")
-    results = await collect_all_raid_metrics()
-    return {
-        "message": "RAID metrics collected successfully",
-        "results": results,
-    }
+
+    async def run() -> Dict[str, Any]:
+        results = await collect_all_raid_metrics()
+        await _finish_manual_collection()
+        return {
+            "message": "RAID metrics collected successfully",
+            "results": results,
+        }
+
+    return await _run_manual_collection("raid", run, background_tasks, background, fields)
+
+
+@dataclass(frozen=True, slots=True)
+class ModuleInfo:
+    """One entry of the /api/modules list (serialised natively by orjson)."""
+    name: str
+    display_name: str
+    container_names: Tuple[str, ...]
+    max_metrics: int
+    max_api_calls: int
+    max_config_options: int
+
+
+@dataclass(frozen=True, slots=True)
+class _ModuleIndex:
+    """Precomputed /api/modules payloads for one module discovery."""
+    # list_modules payload ({"count", "modules": ModuleInfo entries})
+    listing: Dict[str, Any]
+    # APP_NAME -> get_module_details payload
+    details: Dict[str, Dict[str, Any]]
+    # None -> list payload, APP_NAME -> details payload: (JSON bytes, ETag)
+    encoded: Dict[Optional[str], Tuple[bytes, str]]
+
+
+# Built from get_discovered_modules() on first use; reset by /api/modules/reload
+_module_index: Optional[_ModuleIndex] = None
+
+
+def _get_module_index() -> _ModuleIndex:
+    """
+    Get the precomputed module metadata served by the /api/modules endpoints.
+
+    Module classes don't change after discovery, so their metadata is built
+    and JSON-encoded once instead of on every request, and detail lookups
+    are a dict access instead of a scan over the module list.
+
+    Returns:
+        _ModuleIndex for the current module discovery
+    """
+    global _module_index
+    if _module_index is None:
+        modules = get_discovered_modules()
+        module_list = tuple(
+            ModuleInfo(
+                name=module_class.APP_NAME,
+                display_name=module_class.APP_DISPLAY_NAME,
+                container_names=tuple(module_class.CONTAINER_NAMES),
+                max_metrics=module_class.MAX_METRICS,
+                max_api_calls=module_class.MAX_API_CALLS,
+                max_config_options=module_class.MAX_CONFIG_OPTIONS,
+            )
+            for module_class in modules
+        )
+        details: Dict[str, Dict[str, Any]] = {}
+        for module_class in modules:
+            if module_class.APP_NAME in details:
+                continue  # First module discovered for a name wins
+            details[module_class.APP_NAME] = {
+                "name": module_class.APP_NAME,
+                "display_name": module_class.APP_DISPLAY_NAME,
+                "container_names": module_class.CONTAINER_NAMES,
+                "limits": {
+                    "max_metrics": module_class.MAX_METRICS,
+                    "max_api_calls": module_class.MAX_API_CALLS,
+                    "max_config_options": module_class.MAX_CONFIG_OPTIONS,
+                }
+            }
+        listing = {"count": len(module_list), "modules": module_list}
+        encoded: Dict[Optional[str], Tuple[bytes, str]] = {
+            None: (orjson.dumps(listing), compute_etag(listing)),
+        }
+        for app_name, module_details in details.items():
+            encoded[app_name] = (orjson.dumps(module_details), compute_etag(module_details))
+        _module_index = _ModuleIndex(listing=listing, details=details, encoded=encoded)
+    return _module_index
+
+
+def _encoded_json_response(request: Request, encoded: Tuple[bytes, str]) -> Response:
+    """
+    Serve pre-encoded JSON with its ETag (304 if the client's copy matches).
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        encoded: (JSON bytes, ETag) from the module index
+
+    Returns:
+        Response with the JSON body, or an empty 304 Not Modified
+    """
+    body, etag = encoded
+    headers = {"ETag": etag, "Cache-Control": MODULES_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/modules")
-async def list_modules():
+async def list_modules(request: Request, fields: Optional[str] = None):
     """
     List all discovered app modules.
 
@@ -1000,6 +1635,13 @@ async def list_modules():
     their metadata, supported containers, and current status. Modules are
     automatically discovered from the app/collectors/modules/ directory.
 
+    The full list carries an ETag (it only changes when modules are
+    re-discovered); a matching If-None-Match gets an empty 304.
+
+    Args:
+        fields: Comma-separated module keys to return, e.g. "name,display_name"
+            (default: all)
+
     Returns:
         dict: List of modules with their metadata and configuration
 
@@ -1018,32 +1660,49 @@ async def list_modules():
         }
     """
     logger.info("Module list requested via API")
-    modules = get_discovered_modules()
+    index = _get_module_index()
+
+    wanted = _parse_fields(fields)
+    if wanted is None:
+        return _encoded_json_response(request, index.encoded[None])
+    return ORJSONResponse({
+        "count": index.listing["count"],
+        "modules": [_select_fields(asdict(module), wanted) for module in index.listing["modules"]],
+    })
 
-    module_list = []
-    for module_class in modules:
-        module_list.append({
-            "name": module_class.APP_NAME,
-            "display_name": module_class.APP_DISPLAY_NAME,
-            "container_names": module_class.CONTAINER_NAMES,
-            "max_metrics": module_class.MAX_METRICS,
-            "max_api_calls": module_class.MAX_API_CALLS,
-            "max_config_options": module_class.MAX_CONFIG_OPTIONS,
-        })
 
+@app.post("/api/modules/reload")
+async def reload_modules():
+    """
+    Re-scan app/collectors/modules/ for app modules.
+
+    Module discovery runs once per process and is cached; call this after
+    dropping a new module file into the directory to pick it up without
+    restarting.
+
+    Returns:
+        dict: Names of the modules discovered by the re-scan
+    """
+    global _module_index
+    logger.info("Module re-discovery requested via API")
+    clear_module_cache()
+    _module_index = None
+    modules = get_discovered_modules()
     return {
-        "count": len(module_list),
-        "modules": module_list
+        "count": len(modules),
+        "modules": [m.APP_NAME for m in modules],
     }
 
 
 @app.get("/api/modules/{app_name}")
-async def get_module_details(app_name: str):
+async def get_module_details(app_name: str, request: Request):
     """
     Get details for a specific module.
 
     Returns detailed information about a specific app monitoring module
     including its configuration, capabilities, and current status.
+    Carries an ETag like /api/modules; a matching If-None-Match gets an
+    empty 304.
 
     Args:
         app_name: Module app name (e.g., "homeassistant", "qbittorrent")
@@ -1063,32 +1722,27 @@ async def get_module_details(app_name: str):
             }
         }
     """
-    logger.info(f"Module details requested for: {app_name}")
-    modules = get_discovered_modules()
+    logger.info("Module details requested for: %s", app_name)
+    index = _get_module_index()
 
-    # Find the requested module
-    for module_class in modules:
-        if module_class.APP_NAME == app_name:
-            return {
-                "name": module_class.APP_NAME,
-                "display_name": module_class.APP_DISPLAY_NAME,
-                "container_names": module_class.CONTAINER_NAMES,
-                "limits": {
-                    "max_metrics": module_class.MAX_METRICS,
-                    "max_api_calls": module_class.MAX_API_CALLS,
-                    "max_config_options": module_class.MAX_CONFIG_OPTIONS,
-                }
-            }
+    encoded = index.encoded.get(app_name)
+    if encoded is not None:
+        return _encoded_json_response(request, encoded)
 
     # Module not found
     return {
         "error": f"Module '{app_name}' not found",
-        "available_modules": [m.APP_NAME for m in modules]
+        "available_modules": list(index.details)
     }
 
 
 @app.get("/api/collect/modules")
-async def manual_collect_all_modules():
+async def manual_collect_all_modules(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    fields: Optional[str] = None,
+):
     """
     Manually trigger collection for all app modules (for testing).
 
@@ -1098,6 +1752,14 @@ async def manual_collect_all_modules():
 
     Useful for testing module collection and debugging module behavior.
 
+    Send ``Accept: application/x-ndjson`` to stream the results instead:
+    one ``{"<module>_<container>": result}`` line per container, written as
+    each module finishes.
+
+    Pass ``?background=true`` to return 202 with a job id immediately and
+    poll ``/api/collect/jobs/{job_id}`` for the results, and e.g.
+    ``?fields=message,count`` to return only those keys.
+
     Returns:
         dict: Collection results for all modules with execution details
 
@@ -1117,16 +1779,39 @@ async def manual_collect_all_modules():
         }
     """
     logger.info("Manual app module collection triggered via API")
-    results = await collect_all_app_metrics()
-    return {
-        "message": "App module metrics collected successfully",
-        "count": len(results),
-        "results": results,
-    }
+
+    if not background and NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(_stream_app_metrics(), media_type=NDJSON_MEDIA_TYPE)
+
+    async def run() -> Dict[str, Any]:
+        results = await collect_all_app_metrics()
+        await _finish_manual_collection()
+        return {
+            "message": "App module metrics collected successfully",
+            "count": len(results),
+            "results": results,
+        }
+
+    return await _run_manual_collection("modules", run, background_tasks, background, fields)
+
+
+async def _stream_app_metrics() -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per module result as modules finish collecting."""
+    try:
+        async for key, result in iter_app_metrics():
+            yield orjson.dumps({key: result}) + b"\n"
+    finally:
+        # Runs even if the client disconnects mid-stream
+        await _finish_manual_collection()
 
 
 @app.get("/api/collect/modules/{app_name}")
-async def manual_collect_specific_module(app_name: str):
+async def manual_collect_specific_module(
+    app_name: str,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    fields: Optional[str] = None,
+):
     """
     Manually trigger collection for a specific module (for testing).
 
@@ -1134,8 +1819,14 @@ async def manual_collect_specific_module(app_name: str):
     and has matching running containers. Useful for testing individual
     module implementations.
 
+    Pass ``?background=true`` to return 202 with a job id immediately and
+    poll ``/api/collect/jobs/{job_id}`` for the results, and
+    ``?fields=module,count`` to return only those keys.
+
     Args:
         app_name: Module app name (e.g., "homeassistant", "qbittorrent")
+        background: Run the collection as a background job
+        fields: Comma-separated response keys to return (default: all)
 
     Returns:
         dict: Collection results for the specified module
@@ -1150,32 +1841,68 @@ async def manual_collect_specific_module(app_name: str):
             }
         }
     """
-    logger.info(f"Manual collection triggered for module: {app_name}")
+    logger.info("Manual collection triggered for module: %s", app_name)
 
-    # Get all results and filter for the requested module
-    all_results = await collect_all_app_metrics()
+    # Unknown module: answer from the module index without collecting
+    index = _get_module_index()
+    if app_name not in index.details:
+        return {
+            "error": f"Module '{app_name}' not found",
+            "available_modules": list(index.details)
+        }
 
-    # Find results matching this app name
-    matching_results = {
-        key: value for key, value in all_results.items()
-        if key.startswith(f"{app_name}_")
-    }
+    async def run() -> Dict[str, Any]:
+        # Run only the requested module
+        matching_results = await collect_app_metrics_for(app_name)
+        await _finish_manual_collection()
+
+        if not matching_results:
+            return {
+                "error": f"No results for module '{app_name}'",
+                "reason": "No matching containers running",
+                "available_modules": list(index.details)
+            }
 
-    if not matching_results:
-        modules = get_discovered_modules()
-        available = [m.APP_NAME for m in modules]
         return {
-            "error": f"No results for module '{app_name}'",
-            "reason": "Module not found or no matching containers running",
-            "available_modules": available
+            "message": f"Module {app_name} collected successfully",
+            "module": app_name,
+            "count": len(matching_results),
+            "results": matching_results,
         }
 
-    return {
-        "message": f"Module {app_name} collected successfully",
-        "module": app_name,
-        "count": len(matching_results),
-        "results": matching_results,
-    }
+    return await _run_manual_collection(f"modules/{app_name}", run, background_tasks, background, fields)
+
+
+@app.get("/api/collect/jobs/{job_id}")
+async def get_collect_job(job_id: str):
+    """
+    Get the status of a background manual collection job.
+
+    Args:
+        job_id: Job id returned by an /api/collect/* call with ?background=true
+
+    Returns:
+        dict: Job record (status is pending, running, completed or failed;
+        result holds the collection payload once completed)
+
+    Example response:
+        {
+            "job_id": "3f2b...",
+            "type": "docker",
+            "status": "completed",
+            "started": "2026-01-01T12:00:00",
+            "finished": "2026-01-01T12:00:04",
+            "result": {"message": "Docker metrics collected successfully", "results": {...}},
+            "error": null
+        }
+    """
+    job = _collect_jobs.get(job_id)
+    if job is None:
+        return ORJSONResponse(
+            status_code=404,
+            content={"error": f"Collection job '{job_id}' not found"},
+        )
+    return job
 
 
 @app.get("/api/test-alert")
@@ -1197,7 +1924,7 @@ async def test_alert():
             "error": "DISCORD_WEBHOOK_URL not configured in .env file"
         }
 
-    if webhook_url == "https://discord.com/api/webhooks/YOUR_WEBHOOK_HERE":
+    if webhook_url == PLACEHOLDER_WEBHOOK_URL:
         return {
             "success": False,
             "error": "DISCORD_WEBHOOK_URL still has placeholder value - update with real webhook"
@@ -1215,23 +1942,11 @@ async def test_alert():
         }
     )
 
-    # Override title and description for test
-    test_embed["title"] = "🧪 Test Alert - HomeSentry"
-    test_embed["description"] = "If you can see this, Discord alerts are working correctly!"
-    test_embed["fields"] = [
-        {
-            "name": "Status",
-            "value": "✅ Configuration Valid",
-            "inline": True
-        },
-        {
-            "name": "Webhook",
-            "value": "Connected Successfully",
-            "inline": True
-        }
-    ]
+    # Override title, description and fields for test
+    test_embed.update(TEST_ALERT_EMBED)
 
-    success = send_discord_webhook(webhook_url, test_embed)
+    # requests is blocking: send from a worker thread, not the event loop
+    success = await asyncio.to_thread(send_discord_webhook, webhook_url, test_embed)
 
     if success:
         logger.info("Test alert sent successfully")
@@ -1246,6 +1961,29 @@ async def test_alert():
         }
 
 
+@lru_cache(maxsize=8)
+def _sleep_test_results(schedule: Tuple[Any, Any, bool]) -> Tuple[Dict[str, Any], ...]:
+    """
+    Check SLEEP_TEST_TIMES against the sleep schedule.
+
+    Args:
+        schedule: get_sleep_schedule() result; only used as the cache key,
+            so the results are recomputed when the schedule changes
+
+    Returns:
+        Tuple of {"time", "is_sleeping", "reason"} dicts, one per test time
+    """
+    results = []
+    for test_time in SLEEP_TEST_TIMES:
+        is_test_sleeping, test_reason = is_in_sleep_hours(test_time)
+        results.append({
+            "time": test_time.strftime("%H:%M"),
+            "is_sleeping": is_test_sleeping,
+            "reason": test_reason
+        })
+    return tuple(results)
+
+
 @app.get("/api/debug/sleep-schedule")
 async def debug_sleep_schedule():
     """
@@ -1265,33 +2003,13 @@ async def debug_sleep_schedule():
     is_sleeping, reason = is_in_sleep_hours(now)
 
     # Get environment variables for verification
-    env_vars = {
-        "SLEEP_SCHEDULE_ENABLED": os.getenv("SLEEP_SCHEDULE_ENABLED", "(not set)"),
-        "SLEEP_SCHEDULE_START": os.getenv("SLEEP_SCHEDULE_START", "(not set)"),
-        "SLEEP_SCHEDULE_END": os.getenv("SLEEP_SCHEDULE_END", "(not set)"),
-        "SLEEP_SUMMARY_ENABLED": os.getenv("SLEEP_SUMMARY_ENABLED", "(not set)"),
-        "SLEEP_SUMMARY_TIME": os.getenv("SLEEP_SUMMARY_TIME", "(not set)"),
-        "SLEEP_ALLOW_CRITICAL_ALERTS": os.getenv("SLEEP_ALLOW_CRITICAL_ALERTS", "(not set)"),
-    }
+    env_vars = {name: os.environ.get(name, "(not set)") for name in SLEEP_ENV_VARS}
 
     # Test a few specific times
-    test_times = [
-        datetime(2026, 1, 30, 3, 0),   # Middle of night
-        datetime(2026, 1, 30, 7, 30),  # End of sleep
-        datetime(2026, 1, 30, 8, 0),   # Morning
-    ]
-
-    test_results = []
-    for test_time in test_times:
-        is_test_sleeping, test_reason = is_in_sleep_hours(test_time)
-        test_results.append({
-            "time": test_time.strftime("%H:%M"),
-            "is_sleeping": is_test_sleeping,
-            "reason": test_reason
-        })
+    test_results = _sleep_test_results((start_time, end_time, enabled))
 
     return {
-        "current_time": now.strftime("%Y-%m-%d %H:%M:%S"),
+        "current_time": now.isoformat(sep=" ", timespec="seconds"),
         "environment_variables": env_vars,
         "parsed_config": {
             "enabled": enabled,
@@ -1312,11 +2030,14 @@ if __name__ == "__main__":
     # Useful for development/debugging
     import uvicorn
 
-    logger.info("Starting development server...")
+    # Auto-reload (a file watcher plus a restarting child process) only
+    # when DEBUG=true. Always a single worker: each worker would run its
+    # own scheduler and send its own alerts.
+    logger.info(f"Starting server{' (auto-reload)' if DEBUG else ''}...")
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Auto-reload on code changes (development only)
+        reload=DEBUG,
         log_level="info",
     )
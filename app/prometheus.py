@@ -0,0 +1,122 @@
+"""
+Prometheus text exposition for HomeSentry
+
+Renders the latest collected metric samples and service checks in the
+Prometheus text format (version 0.0.4) served at /metrics. Rendering only
+formats rows the scheduler has already written - a scrape never runs a
+collector.
+"""
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+# Starlette appends "; charset=utf-8" to text/* media types itself
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Sample/check status -> numeric gauge value
+STATUS_VALUES = {"OK": 0, "WARN": 1, "FAIL": 2}
+
+
+def _escape_label(value: Any) -> str:
+    """Escape a label value per the exposition format."""
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value (repr keeps full float precision)."""
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _family(
+    lines: List[str],
+    name: str,
+    help_text: str,
+    samples: Iterable[tuple],
+) -> None:
+    """
+    Append one gauge family to ``lines``.
+
+    Args:
+        lines: Output lines
+        name: Metric family name
+        help_text: HELP text
+        samples: (labels string, value) pairs; families with no samples
+            are omitted entirely
+    """
+    samples = list(samples)
+    if not samples:
+        return
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} gauge")
+    for labels, value in samples:
+        lines.append(f"{name}{{{labels}}} {_format_value(value)}")
+
+
+def render_metrics(
+    metrics: List[Dict[str, Any]],
+    services: List[Dict[str, Any]],
+) -> str:
+    """
+    Render metric samples and service checks as Prometheus text.
+
+    Args:
+        metrics: Rows from get_latest_metrics_by_name()
+        services: Rows from get_latest_service_status_by_service()
+
+    Returns:
+        str: Exposition text, ending with a newline
+
+    Example output:
+        # HELP homesentry_metric_value Latest value of each numeric HomeSentry metric
+        # TYPE homesentry_metric_value gauge
+        homesentry_metric_value{category="system",name="cpu_percent"} 12.5
+    """
+    metric_labels = [
+        (f'category="{_escape_label(m["category"])}",name="{_escape_label(m["name"])}"', m)
+        for m in metrics
+    ]
+    service_labels = [
+        (f'service="{_escape_label(s["service"])}"', s)
+        for s in services
+    ]
+
+    def status_value(row: Dict[str, Any]) -> Optional[int]:
+        return STATUS_VALUES.get(row.get("status"))
+
+    lines: List[str] = []
+    _family(
+        lines,
+        "homesentry_metric_value",
+        "Latest value of each numeric HomeSentry metric",
+        ((labels, m["value_num"]) for labels, m in metric_labels if m.get("value_num") is not None),
+    )
+    _family(
+        lines,
+        "homesentry_metric_status",
+        "Latest status of each HomeSentry metric (0=OK, 1=WARN, 2=FAIL)",
+        ((labels, status_value(m)) for labels, m in metric_labels if status_value(m) is not None),
+    )
+    _family(
+        lines,
+        "homesentry_service_status",
+        "Latest health check status of each service (0=OK, 1=WARN, 2=FAIL)",
+        ((labels, status_value(s)) for labels, s in service_labels if status_value(s) is not None),
+    )
+    _family(
+        lines,
+        "homesentry_service_response_ms",
+        "Response time of each service's latest health check in milliseconds",
+        ((labels, s["response_ms"]) for labels, s in service_labels if s.get("response_ms") is not None),
+    )
+    return "\n".join(lines) + "\n"
@@ -25,7 +25,10 @@ from app.collectors import (
     collect_all_raid_metrics,
     collect_all_app_metrics,
 )
-from app.alerts import process_alert
+from app.alerts import process_alert, send_alert_async
+from app.alerts.sleep_schedule import generate_morning_summary
+from app.storage import flush_metric_samples
+from app.storage.db import delete_old_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,11 @@ RAID_POLL_INTERVAL = int(os.getenv("RAID_POLL_INTERVAL", "120"))  # 2 minutes de
 _last_summary_sent: datetime = None
 _last_cleanup_date: Optional[date] = None  # Tracks last nightly cleanup date
 
+# Incremented after every completed collection cycle. The dashboard keeps its
+# assembled payloads in memory until this changes, so polling clients don't
+# re-read SQLite between cycles to get back what the scheduler just wrote.
+_collection_generation: int = 0
+
 # Validate intervals (minimum 10 seconds to prevent hammering)
 if POLL_INTERVAL < 10:
     logger.warning(f"POLL_INTERVAL too low ({POLL_INTERVAL}s), using 10s minimum")
@@ -189,6 +197,22 @@ async def collect_smart_with_alerts() -> Dict[str, Any]:
     return results
 
 
+def get_collection_generation() -> int:
+    """
+    Get the number of collection cycles completed so far.
+
+    Returns:
+        int: Counter that changes whenever new samples have been written
+    """
+    return _collection_generation
+
+
+def _mark_collection_complete() -> None:
+    """Advance the collection generation after a cycle has written its samples."""
+    global _collection_generation
+    _collection_generation += 1
+
+
 async def collect_and_alert() -> None:
     """
     Run all collectors and process alerts.
@@ -283,10 +307,6 @@ async def check_morning_summary() -> None:
     """
     global _last_summary_sent
     
-    from datetime import time
-    from app.alerts.sleep_schedule import generate_morning_summary
-    from app.alerts.discord import send_alert_async
-    
     summary_time_str = os.getenv("SLEEP_SUMMARY_TIME", "")
     
     if not summary_time_str:
@@ -303,7 +323,7 @@ async def check_morning_summary() -> None:
         if len(parts) != 2:
             return
         hour, minute = int(parts[0]), int(parts[1])
-        summary_time = time(hour, minute)
+        summary_time = _time(hour, minute)
     except:
         logger.warning(f"Invalid SLEEP_SUMMARY_TIME: {summary_time_str}")
         return
@@ -360,8 +380,6 @@ async def run_nightly_cleanup() -> None:
     loop.  Uses _last_cleanup_date to ensure it fires only once even if the
     scheduler wakes up multiple times within the same minute.
     """
-    from app.storage.db import delete_old_metrics
-
     retention_days_str = os.getenv("METRICS_RETENTION_DAYS", "30").strip()
     try:
         retention_days = int(retention_days_str)
@@ -425,6 +443,8 @@ async def run_scheduler() -> None:
         await collect_and_alert()
         await collect_smart_cycle()  # Also collect SMART data on startup
         await collect_raid_cycle()   # Also collect RAID data on startup
+        await flush_metric_samples()
+        _mark_collection_complete()
         elapsed = (datetime.now() - start_time).total_seconds()
         logger.info(f"Initial collection completed in {elapsed:.2f}s")
     except Exception as e:
@@ -456,6 +476,10 @@ async def run_scheduler() -> None:
                 logger.info(f"Running RAID collection (cycle #{cycle_count})")
                 await collect_raid_cycle()
             
+            # Write the cycle's buffered samples before publishing it
+            await flush_metric_samples()
+            _mark_collection_complete()
+            
             # Check for morning summary (run every cycle)
             await check_morning_summary()
 
@@ -4,11 +4,17 @@ Database storage modules for persisting metrics and events.
 This module provides database operations for HomeSentry:
 - init_database() - Initialize database tables
 - insert_metric_sample() - Insert metric data
+- buffer_metric_sample() - Queue metric data for the next flush
 - insert_service_status() - Insert service health check
 - insert_event() - Insert state-change event
+- flush_metric_samples() - Write buffered metric samples
 - get_latest_metrics() - Query recent metrics
+- get_latest_metrics_by_name() - Query the newest sample of each metric
 - get_latest_events() - Query recent events
 - get_latest_service_status() - Query recent service checks
+- get_latest_service_status_by_service() - Query the newest check of each service
+- get_dashboard_data() - Query the dashboard's metrics, services and events at once
+- get_latest_snapshot() - Query the newest metrics and service checks (None on failure)
 - get_latest_event_by_key() - Query specific event for state tracking
 - update_event_notified() - Mark event as notified for cooldown tracking
 - insert_sleep_event() - Insert event into sleep queue
@@ -19,14 +25,22 @@ This module provides database operations for HomeSentry:
 """
 
 from .db import (
+    COLLECTOR_TIMING_CATEGORY,
+    DEFAULT_DATABASE_PATH,
     init_database,
     get_connection,
     insert_metric_sample,
+    buffer_metric_sample,
     insert_service_status,
     insert_event,
+    flush_metric_samples,
     get_latest_metrics,
+    get_latest_metrics_by_name,
     get_latest_events,
     get_latest_service_status,
+    get_latest_service_status_by_service,
+    get_dashboard_data,
+    get_latest_snapshot,
     get_latest_event_by_key,
     update_event_notified,
     insert_sleep_event,
@@ -37,14 +51,22 @@ from .db import (
 )
 
 __all__ = [
+    "COLLECTOR_TIMING_CATEGORY",
+    "DEFAULT_DATABASE_PATH",
     "init_database",
     "get_connection",
     "insert_metric_sample",
+    "buffer_metric_sample",
     "insert_service_status",
     "insert_event",
+    "flush_metric_samples",
     "get_latest_metrics",
+    "get_latest_metrics_by_name",
     "get_latest_events",
     "get_latest_service_status",
+    "get_latest_service_status_by_service",
+    "get_dashboard_data",
+    "get_latest_snapshot",
     "get_latest_event_by_key",
     "update_event_notified",
     "insert_sleep_event",
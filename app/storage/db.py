@@ -8,9 +8,12 @@ All database operations are async and use aiosqlite for SQLite access.
 """
 
 import os
+import asyncio
+import json
 import logging
+import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import aiosqlite
 
 from .models import (
@@ -32,6 +35,30 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Metric samples waiting to be written, as metrics_samples rows
+# (ts, category, name, value_num, value_text, status, details_json).
+# Collectors record dozens of samples per cycle; buffering them turns one
+# connection + commit per sample into one executemany + commit per flush.
+_pending_samples: List[Tuple[Any, ...]] = []
+_flush_lock = asyncio.Lock()
+
+# Flush early once this many samples are waiting
+MAX_PENDING_SAMPLES = 500
+
+# Upper bound on samples kept for retry while writes keep failing
+MAX_RETAINED_SAMPLES = 10 * MAX_PENDING_SAMPLES
+
+# Category of the collectors' own timing rows (nanoseconds per collector).
+# Stored so the monitor's overhead is observable, but they aren't host
+# metrics: the latest-metrics reads (dashboard, APIs, /metrics) skip them.
+COLLECTOR_TIMING_CATEGORY = "metrics_collector_ns"
+
+# Database file used when DATABASE_PATH is not set
+DEFAULT_DATABASE_PATH = "data/homesentry.db"
+
+# DATABASE_PATH whose parent directory get_connection() has already created
+_db_dir_ready_for: Optional[str] = None
+
 
 async def get_connection() -> aiosqlite.Connection:
     """
@@ -42,10 +69,13 @@ async def get_connection() -> aiosqlite.Connection:
     Returns:
         aiosqlite.Connection: Database connection
     """
-    db_path = os.getenv("DATABASE_PATH", "data/homesentry.db")
+    global _db_dir_ready_for
+    db_path = os.getenv("DATABASE_PATH", DEFAULT_DATABASE_PATH)
     
-    # Ensure directory exists
-    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    # Ensure directory exists (once per path, not on every connection)
+    if db_path != _db_dir_ready_for:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        _db_dir_ready_for = db_path
     
     return await aiosqlite.connect(db_path)
 
@@ -180,6 +210,103 @@ async def insert_metric_sample(
             await db.close()
 
 
+async def buffer_metric_sample(
+    category: str,
+    name: str,
+    value_num: Optional[float] = None,
+    value_text: Optional[str] = None,
+    status: str = "OK",
+    details_json: Optional[str] = None,
+) -> bool:
+    """
+    Queue a metric sample for the next flush_metric_samples() call.
+    
+    Used by the collectors, whose callers (the scheduler and the manual
+    /api/collect endpoints) flush once per collection run. The sample is
+    timestamped now, so the stored ts is unaffected by when the flush runs.
+    An early flush happens when MAX_PENDING_SAMPLES are waiting.
+    
+    Args:
+        category: Metric category (system, disk, smart, docker, raid)
+        name: Metric name (cpu_percent, disk_/mnt/Array_free_gb, etc.)
+        value_num: Numeric value (optional)
+        value_text: Text value (optional)
+        status: Status (OK, WARN, FAIL)
+        details_json: Additional data as JSON string (optional)
+    
+    Returns:
+        bool: True if queued (and, when an early flush ran, written),
+            False if the early flush failed
+    
+    Examples:
+        >>> await buffer_metric_sample("system", "cpu_percent", value_num=45.2, status="OK")
+        >>> await flush_metric_samples()
+    """
+    # Same format as SQLite's CURRENT_TIMESTAMP (UTC), taken at record time
+    ts = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+    _pending_samples.append((ts, category, name, value_num, value_text, status, details_json))
+    logger.debug(f"Buffered metric: {category}/{name} = {value_num or value_text}")
+    
+    # Exact match: after a failed flush re-queues more than this, don't
+    # retry on every new sample - the end-of-run flush will
+    if len(_pending_samples) == MAX_PENDING_SAMPLES:
+        return await flush_metric_samples()
+    return True
+
+
+async def flush_metric_samples() -> bool:
+    """
+    Write all buffered metric samples in a single transaction.
+    
+    If the write fails, the batch is put back at the front of the buffer
+    so the next flush retries it (the oldest samples are dropped beyond
+    MAX_RETAINED_SAMPLES, so an unreachable database can't grow it forever).
+    
+    Returns:
+        bool: True if successful (or nothing was pending), False otherwise
+    
+    Examples:
+        >>> await buffer_metric_sample("system", "cpu_percent", value_num=45.2)
+        >>> await flush_metric_samples()
+        True
+    """
+    async with _flush_lock:
+        if not _pending_samples:
+            return True
+        
+        # Take the batch; samples recorded while it is written wait for the next flush
+        rows = _pending_samples[:]
+        del _pending_samples[:]
+        
+        db = None
+        try:
+            db = await get_connection()
+            await db.executemany(
+                """
+                INSERT INTO metrics_samples 
+                (ts, category, name, value_num, value_text, status, details_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            await db.commit()
+            logger.debug(f"Flushed {len(rows)} metric samples")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} metric samples: {e}", exc_info=True)
+            # Re-queue ahead of samples recorded meanwhile, keeping the newest
+            _pending_samples[:0] = rows
+            overflow = len(_pending_samples) - MAX_RETAINED_SAMPLES
+            if overflow > 0:
+                del _pending_samples[:overflow]
+                logger.warning(f"Dropped {overflow} oldest unwritten metric samples")
+            return False
+        finally:
+            if db:
+                await db.close()
+
+
 async def insert_service_status(
     service: str,
     status: str,
@@ -302,7 +429,8 @@ async def get_latest_metrics(
     Get latest metric samples from the database.
     
     Args:
-        category: Filter by category (optional, returns all if None)
+        category: Filter by category (optional; if None, returns all
+            categories except COLLECTOR_TIMING_CATEGORY)
         limit: Maximum number of rows to return (default: 100)
     
     Returns:
@@ -329,10 +457,11 @@ async def get_latest_metrics(
         else:
             query = """
                 SELECT * FROM metrics_samples 
+                WHERE category != ?
                 ORDER BY ts DESC 
                 LIMIT ?
             """
-            cursor = await db.execute(query, (limit,))
+            cursor = await db.execute(query, (COLLECTOR_TIMING_CATEGORY, limit))
         
         rows = await cursor.fetchall()
         return [dict(row) for row in rows]
@@ -345,6 +474,89 @@ async def get_latest_metrics(
             await db.close()
 
 
+# Latest-row queries shared by the single-purpose getters and
+# get_dashboard_data(); id breaks ties between rows written in the same second
+LATEST_METRICS_BY_NAME_QUERY = f"""
+    SELECT id, ts, category, name, value_num, value_text, status, details_json
+    FROM (
+        SELECT *,
+               ROW_NUMBER() OVER (PARTITION BY name ORDER BY ts DESC, id DESC) AS rn
+        FROM metrics_samples
+        WHERE ts >= datetime('now', ?)
+        AND category != '{COLLECTOR_TIMING_CATEGORY}'
+        {{category_filter}}
+    )
+    WHERE rn = 1
+    ORDER BY ts DESC, id DESC
+"""
+
+LATEST_SERVICE_STATUS_BY_SERVICE_QUERY = """
+    SELECT id, ts, service, status, response_ms, http_code, details_json
+    FROM (
+        SELECT *,
+               ROW_NUMBER() OVER (PARTITION BY service ORDER BY ts DESC, id DESC) AS rn
+        FROM service_status
+        WHERE ts >= datetime('now', ?)
+    )
+    WHERE rn = 1
+    ORDER BY ts DESC, id DESC
+"""
+
+LATEST_EVENTS_QUERY = """
+    SELECT * FROM events
+    ORDER BY ts DESC
+    LIMIT ?
+"""
+
+
+async def get_latest_metrics_by_name(
+    category: Optional[str] = None,
+    max_age_minutes: int = 60,
+) -> List[Dict[str, Any]]:
+    """
+    Get the most recent sample of every metric name in one query.
+
+    Uses a ROW_NUMBER() window partitioned by name, so callers get exactly
+    one row per metric instead of over-fetching the newest N rows and
+    de-duplicating in Python (which silently drops metrics that were
+    collected less often, such as SMART).
+
+    Args:
+        category: Filter by category (optional, returns all if None;
+            COLLECTOR_TIMING_CATEGORY rows are never returned)
+        max_age_minutes: Ignore samples older than this (default: 60), so
+            metrics that are no longer collected drop off the dashboard
+
+    Returns:
+        List[Dict[str, Any]]: One metric sample per name, newest first
+
+    Examples:
+        >>> latest = await get_latest_metrics_by_name()
+        >>> {m["name"]: m["value_num"] for m in latest}["cpu_percent"]
+        12.5
+    """
+    db = None
+    try:
+        db = await get_connection()
+        db.row_factory = aiosqlite.Row
+
+        lookback = f"-{max_age_minutes} minutes"
+        category_filter = "AND category = ?" if category else ""
+        params = (lookback, category) if category else (lookback,)
+
+        query = LATEST_METRICS_BY_NAME_QUERY.format(category_filter=category_filter)
+        cursor = await db.execute(query, params)
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    except Exception as e:
+        logger.error(f"Failed to get latest metrics by name: {e}", exc_info=True)
+        return []
+    finally:
+        if db:
+            await db.close()
+
+
 async def get_latest_events(limit: int = 50) -> List[Dict[str, Any]]:
     """
     Get latest events from the database.
@@ -365,12 +577,7 @@ async def get_latest_events(limit: int = 50) -> List[Dict[str, Any]]:
         db = await get_connection()
         db.row_factory = aiosqlite.Row
         
-        query = """
-            SELECT * FROM events 
-            ORDER BY ts DESC 
-            LIMIT ?
-        """
-        cursor = await db.execute(query, (limit,))
+        cursor = await db.execute(LATEST_EVENTS_QUERY, (limit,))
         rows = await cursor.fetchall()
         return [dict(row) for row in rows]
         
@@ -433,6 +640,143 @@ async def get_latest_service_status(
             await db.close()
 
 
+async def get_latest_service_status_by_service(
+    max_age_minutes: int = 60,
+) -> List[Dict[str, Any]]:
+    """
+    Get the most recent status check of every service in one query.
+
+    The per-service de-duplication happens in SQL (ROW_NUMBER() partitioned
+    by service), so a service is never crowded out of a fixed-size LIMIT by
+    other services' checks.
+
+    Args:
+        max_age_minutes: Ignore checks older than this (default: 60), so
+            services that are no longer checked drop off the dashboard
+
+    Returns:
+        List[Dict[str, Any]]: One status check per service, newest first
+
+    Examples:
+        >>> statuses = await get_latest_service_status_by_service()
+        >>> {s["service"]: s["status"] for s in statuses}
+        {'plex': 'OK', 'jellyfin': 'OK'}
+    """
+    db = None
+    try:
+        db = await get_connection()
+        db.row_factory = aiosqlite.Row
+
+        cursor = await db.execute(
+            LATEST_SERVICE_STATUS_BY_SERVICE_QUERY, (f"-{max_age_minutes} minutes",)
+        )
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    except Exception as e:
+        logger.error(f"Failed to get latest service status by service: {e}", exc_info=True)
+        return []
+    finally:
+        if db:
+            await db.close()
+
+
+async def get_dashboard_data(
+    max_age_minutes: int = 60,
+    event_limit: int = 20,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Get everything the dashboard page shows over a single connection.
+
+    Runs the get_latest_metrics_by_name(), get_latest_service_status_by_service()
+    and get_latest_events() queries back to back on one connection, so a page
+    load pays for one connect/close instead of three.
+
+    Args:
+        max_age_minutes: Ignore metric samples and service checks older than
+            this (default: 60)
+        event_limit: Maximum number of events to return (default: 20)
+
+    Returns:
+        Tuple of (latest metric per name, latest check per service, latest
+        events); all three are empty lists if the database can't be read
+
+    Examples:
+        >>> metrics, services, events = await get_dashboard_data()
+    """
+    db = None
+    try:
+        db = await get_connection()
+        db.row_factory = aiosqlite.Row
+        lookback = f"-{max_age_minutes} minutes"
+
+        cursor = await db.execute(
+            LATEST_METRICS_BY_NAME_QUERY.format(category_filter=""), (lookback,)
+        )
+        metrics = [dict(row) for row in await cursor.fetchall()]
+
+        cursor = await db.execute(LATEST_SERVICE_STATUS_BY_SERVICE_QUERY, (lookback,))
+        services = [dict(row) for row in await cursor.fetchall()]
+
+        cursor = await db.execute(LATEST_EVENTS_QUERY, (event_limit,))
+        events = [dict(row) for row in await cursor.fetchall()]
+
+        return metrics, services, events
+
+    except Exception as e:
+        logger.error(f"Failed to get dashboard data: {e}", exc_info=True)
+        return [], [], []
+    finally:
+        if db:
+            await db.close()
+
+
+async def get_latest_snapshot(
+    max_age_minutes: int = 60,
+) -> Optional[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+    """
+    Get the newest sample of every metric and check of every service.
+
+    Unlike the single-purpose getters, a read failure is reported as None
+    rather than as empty lists, so callers that publish the data (the
+    /metrics endpoint) can tell "nothing collected" from "database down".
+
+    Args:
+        max_age_minutes: Ignore metric samples and service checks older than
+            this (default: 60)
+
+    Returns:
+        Tuple of (latest metric per name, latest check per service), or None
+        if the database can't be read
+
+    Examples:
+        >>> snapshot = await get_latest_snapshot()
+        >>> metrics, services = snapshot
+    """
+    db = None
+    try:
+        db = await get_connection()
+        db.row_factory = aiosqlite.Row
+        lookback = f"-{max_age_minutes} minutes"
+
+        cursor = await db.execute(
+            LATEST_METRICS_BY_NAME_QUERY.format(category_filter=""), (lookback,)
+        )
+        metrics = [dict(row) for row in await cursor.fetchall()]
+
+        cursor = await db.execute(LATEST_SERVICE_STATUS_BY_SERVICE_QUERY, (lookback,))
+        services = [dict(row) for row in await cursor.fetchall()]
+
+        return metrics, services
+
+    except Exception as e:
+        logger.error(f"Failed to get latest snapshot: {e}", exc_info=True)
+        return None
+    finally:
+        if db:
+            await db.close()
+
+
 async def get_latest_event_by_key(event_key: str) -> Optional[Dict[str, Any]]:
     """
     Get the most recent event for a given event key.
@@ -553,8 +897,6 @@ async def insert_sleep_event(
     Returns:
         bool: True if successful, False otherwise
     """
-    import json
-    
     db = None
     try:
         db = await get_connection()
@@ -589,8 +931,6 @@ async def get_sleep_events() -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: List of sleep events
     """
-    import json
-    
     db = None
     try:
         db = await get_connection()